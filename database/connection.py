@@ -49,6 +49,19 @@ def get_engine(database_url=None):
             st.warning(f"Could not connect to database: {e}")
         return None
 
+def warm_pool(engine):
+    """Open the pool's connections up front so page loads reuse them."""
+    connections = []
+    try:
+        for _ in range(engine.pool.size()):
+            connections.append(engine.connect())
+    except Exception:
+        # Pages report an unreachable database themselves
+        pass
+    finally:
+        for conn in connections:
+            conn.close()
+
 @contextmanager
 def get_session(engine=None):
     """Context manager for database sessions."""
@@ -81,6 +94,8 @@ class DatabaseManager:
     def engine(self):
         if self._engine is None:
             self._engine = get_engine(self.database_url)
+            if self._engine is not None:
+                warm_pool(self._engine)
         return self._engine
     
     def is_connected(self):
@@ -61,11 +61,12 @@ CREATE TABLE IF NOT EXISTS observations (
     country_id INTEGER NOT NULL,
     indicator_id INTEGER NOT NULL,
     year INTEGER NOT NULL,
-    value NUMERIC,
+    value DOUBLE PRECISION,
     is_estimated BOOLEAN DEFAULT FALSE,
     source_note TEXT,
     fetched_at TIMESTAMP DEFAULT NOW(),
     PRIMARY KEY (id, year),
+    CONSTRAINT uq_observation_country_indicator_year UNIQUE (country_id, indicator_id, year) INCLUDE (value),
     FOREIGN KEY (country_id) REFERENCES countries(id),
     FOREIGN KEY (indicator_id) REFERENCES indicators(id)
 ) PARTITION BY RANGE (year);
@@ -104,8 +105,8 @@ CREATE TABLE IF NOT EXISTS observations_2030s PARTITION OF observations
 
 CREATE INDEX IF NOT EXISTS idx_obs_country_year ON observations(country_id, year);
 CREATE INDEX IF NOT EXISTS idx_obs_indicator_year ON observations(indicator_id, year);
-CREATE INDEX IF NOT EXISTS idx_obs_country_indicator ON observations(country_id, indicator_id);
-CREATE INDEX IF NOT EXISTS idx_obs_year ON observations(year);
+CREATE INDEX IF NOT EXISTS idx_obs_year_country_indicator ON observations(year, country_id, indicator_id);
+CREATE INDEX IF NOT EXISTS idx_obs_year_brin ON observations USING brin (year) WITH (pages_per_range = 32);
 
 CREATE INDEX IF NOT EXISTS idx_indicators_source ON indicators(source_id);
 CREATE INDEX IF NOT EXISTS idx_indicators_category ON indicators(category_id);
@@ -0,0 +1,32 @@
+-- ============================================================================
+-- Store observations.value as DOUBLE PRECISION instead of NUMERIC
+-- ============================================================================
+-- For databases created from an init.sql that predates the change.
+-- Rewrites every observations partition, so run it in a maintenance window.
+
+BEGIN;
+
+-- The view depends on the column type and must be recreated
+DROP VIEW IF EXISTS latest_observations;
+
+ALTER TABLE observations
+    ALTER COLUMN value TYPE DOUBLE PRECISION USING value::double precision;
+
+CREATE OR REPLACE VIEW latest_observations AS
+SELECT DISTINCT ON (o.country_id, o.indicator_id)
+    c.iso3_code,
+    c.name AS country_name,
+    c.region,
+    i.code AS indicator_code,
+    i.name AS indicator_name,
+    cat.name AS category,
+    o.year,
+    o.value,
+    o.is_estimated
+FROM observations o
+JOIN countries c ON o.country_id = c.id
+JOIN indicators i ON o.indicator_id = i.id
+LEFT JOIN categories cat ON i.category_id = cat.id
+ORDER BY o.country_id, o.indicator_id, o.year DESC;
+
+COMMIT;
@@ -0,0 +1,36 @@
+-- ============================================================================
+-- Add the (country_id, indicator_id, year) unique key to observations
+-- ============================================================================
+-- For databases created from an init.sql that predates the constraint.
+-- Collectors upsert with ON CONFLICT (country_id, indicator_id, year), which
+-- fails without it. Older collectors appended rows blindly, so duplicate
+-- keys are removed first, keeping the most recently fetched row of each.
+
+BEGIN;
+
+DELETE FROM observations o
+USING (
+    SELECT id, year,
+           ROW_NUMBER() OVER (
+               PARTITION BY country_id, indicator_id, year
+               ORDER BY fetched_at DESC NULLS LAST, id DESC
+           ) AS rn
+    FROM observations
+) dup
+WHERE o.id = dup.id
+  AND o.year = dup.year
+  AND dup.rn > 1;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'uq_observation_country_indicator_year'
+    ) THEN
+        ALTER TABLE observations
+            ADD CONSTRAINT uq_observation_country_indicator_year
+            UNIQUE (country_id, indicator_id, year);
+    END IF;
+END $$;
+
+COMMIT;
@@ -0,0 +1,24 @@
+-- ============================================================================
+-- Cover series lookups with the observation key and index year with BRIN
+-- ============================================================================
+-- For databases created from an init.sql that predates the change; run after
+-- 002_observation_unique_key.sql. Rebuilds the unique key on every
+-- observations partition, so run it in a maintenance window.
+
+BEGIN;
+
+-- INCLUDE value so reads by country and indicator are index-only scans
+ALTER TABLE observations
+    DROP CONSTRAINT IF EXISTS uq_observation_country_indicator_year;
+ALTER TABLE observations
+    ADD CONSTRAINT uq_observation_country_indicator_year
+    UNIQUE (country_id, indicator_id, year) INCLUDE (value);
+
+-- Covered by the unique key's index
+DROP INDEX IF EXISTS idx_obs_country_indicator;
+
+-- Year follows physical order within each partition; BRIN is far smaller
+DROP INDEX IF EXISTS idx_obs_year;
+CREATE INDEX IF NOT EXISTS idx_obs_year_brin ON observations USING brin (year) WITH (pages_per_range = 32);
+
+COMMIT;
@@ -0,0 +1,13 @@
+-- ============================================================================
+-- Year-first composite index for year-scoped observation queries
+-- ============================================================================
+-- For databases created from an init.sql that predates the change. Builds the
+-- index on every observations partition, so run it in a maintenance window.
+
+BEGIN;
+
+-- Matches the year -> country -> indicator filter order of QueryBuilder
+CREATE INDEX IF NOT EXISTS idx_obs_year_country_indicator
+    ON observations(year, country_id, indicator_id);
+
+COMMIT;
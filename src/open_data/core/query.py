@@ -0,0 +1,660 @@
+"""
+Query Engine for Open Data Platform.
+
+Provides a high-level API for querying, filtering, and aggregating data.
+Supports time series operations, cross-country comparisons, and statistical analysis.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from functools import wraps
+from typing import Any, Callable, Generator, Literal
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Select, and_, case, func, or_, select
+from sqlalchemy.orm import Session
+
+from open_data.config import COUNTRIES, Region, get_countries_by_region
+from open_data.db.connection import session_scope
+from open_data.db.models import Category, Country, Indicator, Observation, Source
+
+# Label columns of query results that are stored as pandas categoricals
+_CATEGORY_COLUMNS = ("country", "country_name", "region", "indicator", "indicator_name")
+
+# Region membership is static, so resolve it once at import time
+_REGION_TO_ISO3: dict[Region, tuple[str, ...]] = {
+    region: tuple(c.iso3 for c in get_countries_by_region(region)) for region in Region
+}
+
+# Session shared by queries run inside DataQuery.open_session()
+_active_session: ContextVar[Session | None] = ContextVar("_active_session", default=None)
+
+
+def _read_frame(stmt: Select, session: Session | None = None) -> pd.DataFrame:
+    """
+    Read a SELECT into an Arrow-backed DataFrame.
+
+    Uses the given or active session, or a fresh session scope.
+    """
+    session = session or _active_session.get()
+    if session is not None:
+        return pd.read_sql_query(stmt, session.connection(), dtype_backend="pyarrow")
+
+    with session_scope() as scoped:
+        return pd.read_sql_query(stmt, scoped.connection(), dtype_backend="pyarrow")
+
+
+class AggregateFunction(str, Enum):
+    """Supported aggregation functions."""
+    SUM = "sum"
+    MEAN = "mean"
+    MEDIAN = "median"
+    MIN = "min"
+    MAX = "max"
+    STD = "std"
+    COUNT = "count"
+    FIRST = "first"
+    LAST = "last"
+
+
+@dataclass
+class QueryResult:
+    """Result of a query operation."""
+    data: pd.DataFrame
+    query_time: float
+    row_count: int
+    metadata: dict[str, Any]
+
+    def to_dict(self) -> dict:
+        return {
+            "data": self.data.to_dict("records"),
+            "query_time": self.query_time,
+            "row_count": self.row_count,
+            "metadata": self.metadata,
+        }
+
+
+class QueryBuilder:
+    """
+    Fluent query builder for constructing complex data queries.
+
+    Example:
+        result = (
+            QueryBuilder()
+            .select("NY.GDP.PCAP.CD", "FP.CPI.TOTL.ZG")
+            .countries("ARG", "BRA", "CHL")
+            .years(2010, 2023)
+            .execute()
+        )
+    """
+
+    def __init__(self, session: Session | None = None):
+        self._session = session
+        self._indicators: list[str] = []
+        self._countries: list[str] = []
+        self._regions: list[Region] = []
+        self._start_year: int | None = None
+        self._end_year: int | None = None
+        self._pivot: bool = False
+        self._metadata: bool = True
+        self._aggregate_by: str | None = None
+        self._aggregate_func: AggregateFunction = AggregateFunction.MEAN
+
+    def select(self, *indicators: str) -> "QueryBuilder":
+        """Select indicators to query."""
+        self._indicators.extend(indicators)
+        return self
+
+    def countries(self, *country_codes: str) -> "QueryBuilder":
+        """Filter by country codes (ISO3)."""
+        self._countries.extend(map(str.upper, country_codes))
+        return self
+
+    def regions(self, *regions: str | Region) -> "QueryBuilder":
+        """Filter by regions."""
+        for r in regions:
+            if isinstance(r, str):
+                self._regions.append(Region(r.upper()))
+            else:
+                self._regions.append(r)
+        return self
+
+    def years(self, start: int, end: int | None = None) -> "QueryBuilder":
+        """Filter by year range."""
+        self._start_year = start
+        self._end_year = end or datetime.now().year
+        return self
+
+    def year(self, year: int) -> "QueryBuilder":
+        """Filter to a single year."""
+        self._start_year = year
+        self._end_year = year
+        return self
+
+    def pivot(self, pivot: bool = True) -> "QueryBuilder":
+        """Pivot indicators as columns."""
+        self._pivot = pivot
+        return self
+
+    def with_metadata(self, include: bool = True) -> "QueryBuilder":
+        """Include country/indicator names and region in the results."""
+        self._metadata = include
+        return self
+
+    def aggregate(
+        self,
+        by: Literal["country", "year", "region"],
+        func: AggregateFunction | str = AggregateFunction.MEAN,
+    ) -> "QueryBuilder":
+        """Aggregate results."""
+        self._aggregate_by = by
+        if isinstance(func, str):
+            self._aggregate_func = AggregateFunction(func)
+        else:
+            self._aggregate_func = func
+        return self
+
+    def _get_country_list(self) -> list[str]:
+        """Get the final list of country codes."""
+        countries = set(self._countries)
+
+        for region in self._regions:
+            countries.update(_REGION_TO_ISO3[region])
+
+        return list(countries) if countries else list(COUNTRIES.keys())
+
+    def _build_statement(self) -> Select:
+        """Build the Core SELECT for the current filters."""
+        # Region aggregation needs the region column regardless
+        if self._metadata or self._aggregate_by == "region":
+            columns = (
+                Country.iso3_code.label("country"),
+                Country.name.label("country_name"),
+                Country.region.label("region"),
+                Indicator.code.label("indicator"),
+                Indicator.name.label("indicator_name"),
+                Observation.year,
+                Observation.value,
+            )
+        else:
+            columns = (
+                Country.iso3_code.label("country"),
+                Indicator.code.label("indicator"),
+                Observation.year,
+                Observation.value,
+            )
+
+        stmt = (
+            select(*columns)
+            .join(Observation, Country.id == Observation.country_id)
+            .join(Indicator, Indicator.id == Observation.indicator_id)
+        )
+
+        # Apply filters, most selective first: year, then country, then indicator
+        if self._start_year:
+            stmt = stmt.where(Observation.year >= self._start_year)
+
+        if self._end_year:
+            stmt = stmt.where(Observation.year <= self._end_year)
+
+        stmt = stmt.where(Country.iso3_code.in_(self._get_country_list()))
+
+        if self._indicators:
+            stmt = stmt.where(Indicator.code.in_(self._indicators))
+
+        # Order by
+        return stmt.order_by(
+            Country.iso3_code,
+            Indicator.code,
+            Observation.year,
+        )
+
+    def execute(self) -> QueryResult:
+        """Execute the query and return results."""
+        start_time = time.perf_counter()
+
+        # A Core select() (with expanding IN parameters) is served from the
+        # engine's compiled cache on repeated calls
+        stmt = self._build_statement()
+
+        df = _read_frame(stmt, self._session)
+
+        if df.empty:
+            return QueryResult(
+                data=df,
+                query_time=time.perf_counter() - start_time,
+                row_count=0,
+                metadata={"filters": self._get_metadata()},
+            )
+
+        # Values stay NumPy float64 (nulls as NaN) for the analysis modules
+        df["value"] = df["value"].astype("float64")
+
+        # Compact dtypes: low-cardinality labels as categoricals, years as int16
+        for col in df.columns.intersection(_CATEGORY_COLUMNS):
+            df[col] = df[col].astype("category")
+        df["year"] = df["year"].astype("int16")
+
+        # Apply aggregation if specified
+        if self._aggregate_by:
+            df = self._apply_aggregation(df)
+
+        # Pivot if requested
+        if self._pivot and not self._aggregate_by:
+            df = self._apply_pivot(df)
+
+        query_time = time.perf_counter() - start_time
+
+        return QueryResult(
+            data=df,
+            query_time=query_time,
+            row_count=len(df),
+            metadata={"filters": self._get_metadata()},
+        )
+
+    def _apply_aggregation(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply aggregation to the DataFrame."""
+        agg_funcs = {
+            AggregateFunction.SUM: "sum",
+            AggregateFunction.MEAN: "mean",
+            AggregateFunction.MEDIAN: "median",
+            AggregateFunction.MIN: "min",
+            AggregateFunction.MAX: "max",
+            AggregateFunction.STD: "std",
+            AggregateFunction.COUNT: "count",
+            AggregateFunction.FIRST: "first",
+            AggregateFunction.LAST: "last",
+        }
+
+        func_name = agg_funcs[self._aggregate_func]
+
+        if self._aggregate_by == "country":
+            keys = [c for c in ("country", "country_name", "indicator") if c in df.columns]
+            return df.groupby(keys, observed=True).agg({
+                "value": func_name,
+                "year": ["min", "max"],
+            }).reset_index()
+
+        elif self._aggregate_by == "year":
+            return df.groupby(["year", "indicator"], observed=True).agg({
+                "value": func_name,
+                "country": "count",
+            }).reset_index()
+
+        elif self._aggregate_by == "region":
+            return df.groupby(["region", "indicator", "year"], observed=True).agg({
+                "value": func_name,
+                "country": "count",
+            }).reset_index()
+
+        return df
+
+    def _apply_pivot(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Pivot DataFrame so indicators become columns."""
+        if len(self._indicators) <= 1:
+            return df
+
+        pivot = df.pivot_table(
+            index=[c for c in ("country", "country_name", "year") if c in df.columns],
+            columns="indicator",
+            values="value",
+            aggfunc="first",
+            observed=True,
+        ).reset_index()
+
+        pivot.columns.name = None
+        return pivot
+
+    def _get_metadata(self) -> dict:
+        """Get query metadata."""
+        return {
+            "indicators": self._indicators,
+            "countries": self._countries,
+            "regions": [r.value for r in self._regions],
+            "start_year": self._start_year,
+            "end_year": self._end_year,
+            "pivot": self._pivot,
+            "metadata": self._metadata,
+            "aggregate_by": self._aggregate_by,
+        }
+
+
+class DataQuery:
+    """
+    High-level data query interface.
+
+    Provides convenient methods for common query patterns.
+    """
+
+    @classmethod
+    @contextmanager
+    def open_session(cls) -> Generator[Session, None, None]:
+        """
+        Share one session across all queries run inside the block.
+
+        Usage:
+            with DataQuery.open_session():
+                gdp = DataQuery.get_latest_values("NY.GDP.PCAP.CD")
+                cpi = DataQuery.get_latest_values("FP.CPI.TOTL.ZG")
+        """
+        with session_scope() as session:
+            token = _active_session.set(session)
+            try:
+                yield session
+            finally:
+                _active_session.reset(token)
+
+    @staticmethod
+    def get_indicator(
+        indicator_code: str,
+        countries: list[str] | None = None,
+        start_year: int = 2000,
+        end_year: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get data for a single indicator.
+
+        Args:
+            indicator_code: The indicator code.
+            countries: List of country codes (optional).
+            start_year: Start year.
+            end_year: End year.
+
+        Returns:
+            DataFrame with the data.
+        """
+        builder = QueryBuilder().select(indicator_code).years(start_year, end_year)
+
+        if countries:
+            builder.countries(*countries)
+
+        return builder.execute().data
+
+    @staticmethod
+    def compare_countries(
+        indicator_code: str,
+        countries: list[str],
+        year: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Compare countries for a specific indicator.
+
+        Args:
+            indicator_code: The indicator to compare.
+            countries: List of country codes.
+            year: Specific year (or latest if None).
+
+        Returns:
+            DataFrame with comparison data.
+        """
+        builder = (
+            QueryBuilder()
+            .select(indicator_code)
+            .countries(*countries)
+        )
+
+        if year:
+            builder.year(year)
+        else:
+            builder.years(2020, datetime.now().year)
+
+        df = builder.execute().data
+
+        if not year and not df.empty:
+            # Get the latest year for each country
+            df = df.sort_values(["country", "year"], kind="stable").drop_duplicates(
+                "country", keep="last"
+            )
+
+        return df.sort_values("value", ascending=False)
+
+    @staticmethod
+    def get_time_series(
+        indicator_code: str,
+        country: str,
+        start_year: int = 1960,
+        end_year: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get time series for a single country and indicator.
+
+        Args:
+            indicator_code: The indicator code.
+            country: Country code (ISO3).
+            start_year: Start year.
+            end_year: End year.
+
+        Returns:
+            DataFrame with time series.
+        """
+        return (
+            QueryBuilder()
+            .select(indicator_code)
+            .countries(country)
+            .years(start_year, end_year)
+            .with_metadata(False)
+            .execute()
+            .data
+        )
+
+    @staticmethod
+    def get_latest_values(
+        indicator_code: str,
+        countries: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get the most recent value for each country.
+
+        Args:
+            indicator_code: The indicator code.
+            countries: List of countries (optional).
+
+        Returns:
+            DataFrame with latest values.
+        """
+        builder = (
+            QueryBuilder()
+            .select(indicator_code)
+            .years(2015, datetime.now().year)
+        )
+
+        if countries:
+            builder.countries(*countries)
+
+        df = builder.execute().data
+
+        if df.empty:
+            return df
+
+        # Get the latest year for each country
+        df = df.sort_values(["country", "year"], kind="stable").drop_duplicates(
+            "country", keep="last"
+        )
+        return df.sort_values("value", ascending=False)
+
+    @staticmethod
+    def get_regional_averages(
+        indicator_code: str,
+        year: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get average values by region.
+
+        Args:
+            indicator_code: The indicator code.
+            year: Specific year (or latest if None).
+
+        Returns:
+            DataFrame with regional averages.
+        """
+        builder = QueryBuilder().select(indicator_code)
+
+        if year:
+            builder.year(year)
+        else:
+            builder.years(2020, datetime.now().year)
+
+        builder.aggregate("region", AggregateFunction.MEAN)
+
+        return builder.execute().data
+
+    @staticmethod
+    def get_multi_indicator(
+        indicators: list[str],
+        countries: list[str],
+        year: int,
+    ) -> pd.DataFrame:
+        """
+        Get multiple indicators for multiple countries in a single year.
+
+        Args:
+            indicators: List of indicator codes.
+            countries: List of country codes (all countries if empty).
+            year: The year to query.
+
+        Returns:
+            DataFrame with indicators as columns.
+        """
+        indicators = list(dict.fromkeys(indicators))
+        countries = [c.upper() for c in countries] or list(COUNTRIES.keys())
+
+        # Pivot in the database with one conditional aggregate per indicator,
+        # so a single row per (country, year) comes back already wide.
+        stmt = (
+            select(
+                Country.iso3_code.label("country"),
+                Country.name.label("country_name"),
+                Observation.year,
+                *[
+                    func.max(case((Indicator.code == code, Observation.value))).label(code)
+                    for code in indicators
+                ],
+            )
+            .join(Observation, Country.id == Observation.country_id)
+            .join(Indicator, Indicator.id == Observation.indicator_id)
+            .where(Indicator.code.in_(indicators))
+            .where(Country.iso3_code.in_(countries))
+            .where(Observation.year == year)
+            # Countries with no value for any indicator get no row, as with pivot_table
+            .where(Observation.value.isnot(None))
+            .group_by(Country.iso3_code, Country.name, Observation.year)
+            .order_by(Country.iso3_code)
+        )
+
+        df = _read_frame(stmt)
+        for code in indicators:
+            df[code] = df[code].astype("float64")
+
+        return df
+
+
+def query(
+    indicator: str | list[str],
+    countries: str | list[str] | None = None,
+    region: str | None = None,
+    start_year: int = 2000,
+    end_year: int | None = None,
+) -> pd.DataFrame:
+    """
+    Simple query function for quick data access.
+
+    Args:
+        indicator: Indicator code(s).
+        countries: Country code(s).
+        region: Region name.
+        start_year: Start year.
+        end_year: End year.
+
+    Returns:
+        DataFrame with results.
+    """
+    builder = QueryBuilder()
+
+    # Handle indicators
+    if isinstance(indicator, str):
+        builder.select(indicator)
+    else:
+        builder.select(*indicator)
+
+    # Handle countries
+    if countries:
+        if isinstance(countries, str):
+            builder.countries(countries)
+        else:
+            builder.countries(*countries)
+
+    # Handle region
+    if region:
+        builder.regions(region)
+
+    # Handle years
+    builder.years(start_year, end_year)
+
+    return builder.execute().data
+
+
+def _ttl_cache(ttl_seconds: float) -> Callable[[Callable[[], pd.DataFrame]], Any]:
+    """
+    Cache the DataFrame returned by a zero-argument function for ttl_seconds.
+
+    The wrapped function gains an ``invalidate()`` attribute that drops the
+    cached result, e.g. after new data has been ingested.
+    """
+
+    def decorator(fn: Callable[[], pd.DataFrame]) -> Any:
+        cache: dict[str, tuple[float, pd.DataFrame]] = {}
+
+        @wraps(fn)
+        def wrapper() -> pd.DataFrame:
+            entry = cache.get("result")
+            if entry is None or entry[0] <= time.monotonic():
+                entry = (time.monotonic() + ttl_seconds, fn())
+                cache["result"] = entry
+            return entry[1].copy()
+
+        wrapper.invalidate = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+@_ttl_cache(ttl_seconds=300)
+def get_available_data_summary() -> pd.DataFrame:
+    """
+    Get a summary of available data in the database.
+
+    The result is cached for five minutes; call
+    ``get_available_data_summary.invalidate()`` to force a refresh.
+
+    Returns:
+        DataFrame with indicator availability summary.
+    """
+    with session_scope() as session:
+        summary = (
+            session.query(
+                Source.code.label("source"),
+                Category.code.label("category"),
+                Indicator.code,
+                Indicator.name,
+                func.count(Observation.id).label("observations"),
+                func.count(func.distinct(Observation.country_id)).label("countries"),
+                func.min(Observation.year).label("min_year"),
+                func.max(Observation.year).label("max_year"),
+            )
+            .join(Indicator, Source.id == Indicator.source_id)
+            .outerjoin(Category, Category.id == Indicator.category_id)
+            .join(Observation, Indicator.id == Observation.indicator_id)
+            .group_by(Source.code, Category.code, Indicator.code, Indicator.name)
+            .order_by(Source.code, Category.code, Indicator.code)
+            .all()
+        )
+
+        return pd.DataFrame(summary, columns=[
+            "source", "category", "code", "name",
+            "observations", "countries", "min_year", "max_year"
+        ])
@@ -0,0 +1,740 @@
+"""
+Statistical Analysis Module.
+
+Provides statistical analysis capabilities:
+- Descriptive statistics
+- Correlation analysis
+- Distribution analysis
+- Comparative statistics
+- Hypothesis testing
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from open_data.core.query import DataQuery, QueryBuilder
+
+
+def _drop_nan(values: np.ndarray | pd.Series) -> np.ndarray:
+    """Return the non-NaN entries of values as a new float64 array."""
+    values = np.asarray(values, dtype=np.float64)
+    keep = np.isnan(values)
+    np.logical_not(keep, out=keep)
+    return values[keep]
+
+
+@dataclass(frozen=True)
+class _Distribution:
+    """NaN-free distribution with the summaries the scoring helpers need."""
+    sorted: np.ndarray
+    mean: float
+    std: float
+
+
+def _prepared(values: np.ndarray | pd.Series) -> _Distribution:
+    """Drop NaNs once and precompute what percentile_rank/z_score need."""
+    clean = _drop_nan(values)
+    if len(clean) == 0:
+        return _Distribution(sorted=clean, mean=np.nan, std=np.nan)
+    mean = clean.mean()
+    std = clean.std()
+    clean.sort()  # _drop_nan returned a fresh array
+    return _Distribution(sorted=clean, mean=mean, std=std)
+
+
+def _fast_pearson(x: np.ndarray, y: np.ndarray) -> tuple[float, float]:
+    """
+    Pearson r and two-sided p-value for short NaN-free samples.
+
+    Same test as ``stats.pearsonr``, without its input validation and
+    dispatch overhead, which dominates at country-level sample sizes.
+    """
+    xm = x - x.mean()
+    ym = y - y.mean()
+    dof = len(x) - 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.dot(xm, ym) / np.sqrt(np.dot(xm, xm) * np.dot(ym, ym))
+        r = min(max(r, -1.0), 1.0)
+        t_stat = r * np.sqrt(dof / max(1.0 - r * r, 1e-300))
+
+    return float(r), float(2 * stats.t.sf(abs(t_stat), dof))
+
+
+def _nancorr(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pairwise-complete Pearson correlation of the columns of a 2-D array.
+
+    Each pair of columns is correlated over the rows where both are
+    non-NaN, like pandas' ``nancorr``. All pairs are computed at once with
+    masked matrix products instead of a Python loop over pairs.
+
+    Returns:
+        Tuple of (correlation matrix, matrix of paired observation counts).
+    """
+    present = ~np.isnan(values)
+    mask = present.astype(np.float64)
+    x = np.where(present, values, 0.0)
+
+    # Shift columns to zero mean first so the sums of squares below do not
+    # lose precision on large-magnitude indicators (e.g. GDP in USD)
+    x -= x.sum(axis=0) / np.maximum(mask.sum(axis=0), 1.0)
+    x *= mask
+
+    nobs = mask.T @ mask
+    sum_x = x.T @ mask  # sum of column i over rows shared with column j
+    sum_xx = (x * x).T @ mask
+    sum_xy = x.T @ x
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sum_xy - sum_x * sum_x.T / nobs
+        var_x = sum_xx - sum_x**2 / nobs
+        corr = cov / np.sqrt(var_x * var_x.T)
+
+    return np.clip(corr, -1.0, 1.0), nobs
+
+
+def _pearson_pvalues(corr: np.ndarray, nobs: np.ndarray | int) -> np.ndarray:
+    """
+    Two-sided p-values for a symmetric matrix of Pearson coefficients.
+
+    Uses t = r * sqrt((n - 2) / (1 - r^2)) with n - 2 degrees of freedom,
+    the same test ``stats.pearsonr`` applies per pair. Only the upper
+    triangle is evaluated and mirrored; the diagonal is zero.
+    """
+    rows, cols = np.triu_indices(len(corr), k=1)
+    r = corr[rows, cols]
+    dof = np.broadcast_to(np.asarray(nobs, dtype=np.float64), corr.shape)[rows, cols] - 2
+
+    with np.errstate(invalid="ignore"):
+        t_stat = r * np.sqrt(dof / np.clip(1.0 - r**2, 1e-300, None))
+        upper = 2 * stats.t.sf(np.abs(t_stat), dof)
+
+    pvalues = np.zeros(corr.shape)
+    pvalues[rows, cols] = upper
+    pvalues[cols, rows] = upper
+    return pvalues
+
+
+@dataclass
+class DescriptiveStats:
+    """Descriptive statistics for a dataset."""
+    count: int
+    mean: float
+    std: float
+    min: float
+    q25: float
+    median: float
+    q75: float
+    max: float
+    skewness: float
+    kurtosis: float
+    cv: float  # Coefficient of variation
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min,
+            "q25": self.q25,
+            "median": self.median,
+            "q75": self.q75,
+            "max": self.max,
+            "skewness": self.skewness,
+            "kurtosis": self.kurtosis,
+            "cv": self.cv,
+        }
+
+
+@dataclass
+class CorrelationResult:
+    """Result of correlation analysis."""
+    indicator1: str
+    indicator2: str
+    correlation: float
+    p_value: float
+    n_observations: int
+    method: str
+
+    @property
+    def is_significant(self) -> bool:
+        return self.p_value < 0.05
+
+    @property
+    def strength(self) -> str:
+        r = abs(self.correlation)
+        if r < 0.2:
+            return "negligible"
+        elif r < 0.4:
+            return "weak"
+        elif r < 0.6:
+            return "moderate"
+        elif r < 0.8:
+            return "strong"
+        else:
+            return "very strong"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "indicator1": self.indicator1,
+            "indicator2": self.indicator2,
+            "correlation": self.correlation,
+            "p_value": self.p_value,
+            "n_observations": self.n_observations,
+            "is_significant": self.is_significant,
+            "strength": self.strength,
+            "method": self.method,
+        }
+
+
+@dataclass
+class ComparisonResult:
+    """Result of statistical comparison."""
+    group1: str
+    group2: str
+    mean1: float
+    mean2: float
+    difference: float
+    pct_difference: float
+    t_statistic: float
+    p_value: float
+    is_significant: bool
+    effect_size: float  # Cohen's d
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "group1": self.group1,
+            "group2": self.group2,
+            "mean1": self.mean1,
+            "mean2": self.mean2,
+            "difference": self.difference,
+            "pct_difference": self.pct_difference,
+            "t_statistic": self.t_statistic,
+            "p_value": self.p_value,
+            "is_significant": self.is_significant,
+            "effect_size": self.effect_size,
+        }
+
+
+class StatisticalAnalyzer:
+    """
+    Perform statistical analysis on economic data.
+    """
+
+    @staticmethod
+    def descriptive_stats(values: np.ndarray | pd.Series) -> DescriptiveStats:
+        """
+        Calculate descriptive statistics.
+
+        Args:
+            values: Array of numeric values.
+
+        Returns:
+            DescriptiveStats object.
+        """
+        values = _drop_nan(values)
+
+        n = len(values)
+        if n == 0:
+            raise ValueError("No valid data points")
+
+        # One sort serves min, max and every quantile (linear interpolation,
+        # as np.percentile does)
+        ordered = np.sort(values)
+
+        def quantile(q: float) -> float:
+            pos = q * (n - 1)
+            lo = int(pos)
+            hi = min(lo + 1, n - 1)
+            return float(ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo))
+
+        # Central moments from a single centered array; skewness and kurtosis
+        # use the same biased estimators as stats.skew / stats.kurtosis.
+        # `values` is already a private copy, so center it in place and let
+        # dot products do the power sums without extra temporaries.
+        mean = float(values.mean())
+        centered = np.subtract(values, mean, out=values)
+        squared = centered * centered
+        m2 = np.dot(centered, centered) / n
+        m3 = np.dot(squared, centered) / n
+        m4 = np.dot(squared, squared) / n
+        std_pop = np.sqrt(m2)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            skewness = m3 / m2**1.5 if n > 2 else 0
+            kurtosis = m4 / m2**2 - 3.0 if n > 3 else 0
+
+        return DescriptiveStats(
+            count=n,
+            mean=mean,
+            std=float(np.sqrt(m2 * n / (n - 1))) if n > 1 else 0,
+            min=float(ordered[0]),
+            q25=quantile(0.25),
+            median=quantile(0.5),
+            q75=quantile(0.75),
+            max=float(ordered[-1]),
+            skewness=float(skewness),
+            kurtosis=float(kurtosis),
+            cv=float(std_pop / mean * 100) if mean != 0 else 0,
+        )
+
+    @staticmethod
+    def correlation(
+        x: np.ndarray | pd.Series,
+        y: np.ndarray | pd.Series,
+        method: str = "pearson",
+    ) -> CorrelationResult:
+        """
+        Calculate correlation between two variables.
+
+        Args:
+            x: First variable.
+            y: Second variable.
+            method: 'pearson', 'spearman', or 'kendall'.
+
+        Returns:
+            CorrelationResult object.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        # Remove NaN pairs, reusing one boolean buffer for the combined mask
+        mask = np.isnan(x)
+        np.logical_or(mask, np.isnan(y), out=mask)
+        np.logical_not(mask, out=mask)
+        x = x[mask]
+        y = y[mask]
+
+        if len(x) < 3:
+            raise ValueError("Need at least 3 paired observations")
+
+        if method == "pearson" and len(x) < 1000:
+            r, p = _fast_pearson(x, y)
+        elif method == "pearson":
+            r, p = stats.pearsonr(x, y)
+        elif method == "spearman":
+            r, p = stats.spearmanr(x, y)
+        elif method == "kendall":
+            r, p = stats.kendalltau(x, y)
+        else:
+            raise ValueError(f"Unknown method: {method}")
+
+        return CorrelationResult(
+            indicator1="x",
+            indicator2="y",
+            correlation=float(r),
+            p_value=float(p),
+            n_observations=len(x),
+            method=method,
+        )
+
+    @staticmethod
+    def correlation_matrix(
+        df: pd.DataFrame,
+        method: str = "pearson",
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Calculate correlation matrix.
+
+        Args:
+            df: DataFrame with numeric columns.
+            method: Correlation method.
+
+        Returns:
+            Tuple of (correlation matrix, p-value matrix).
+        """
+        cols = df.select_dtypes(include=[np.number]).columns
+        n = len(cols)
+
+        values = df[cols].to_numpy(dtype=np.float64)
+        complete = len(values) >= 3 and not np.isnan(values).any()
+
+        # Spearman is Pearson on ranks. With complete data each column can be
+        # ranked once up front; with gaps every pair must be re-ranked over
+        # its shared rows, so that case stays on the per-pair path below.
+        if method == "spearman" and complete:
+            values = stats.rankdata(values, axis=0)
+
+        if method == "pearson" or (method == "spearman" and complete):
+            if complete:
+                # Complete data: one corrcoef call over all columns
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    corr_matrix = np.corrcoef(values, rowvar=False)
+                nobs = len(values)
+            else:
+                # Missing data: pairwise-complete correlations, as the
+                # per-pair path computes them
+                corr_matrix, nobs = _nancorr(values)
+                corr_matrix[nobs < 3] = np.nan
+
+            pval_matrix = _pearson_pvalues(corr_matrix, nobs)
+            np.fill_diagonal(corr_matrix, 1.0)
+
+            return (
+                pd.DataFrame(corr_matrix, index=cols, columns=cols),
+                pd.DataFrame(pval_matrix, index=cols, columns=cols),
+            )
+
+        corr_matrix = np.zeros((n, n))
+        pval_matrix = np.zeros((n, n))
+
+        for i in range(n):
+            for j in range(n):
+                if i == j:
+                    corr_matrix[i, j] = 1.0
+                    pval_matrix[i, j] = 0.0
+                elif j > i:
+                    try:
+                        result = StatisticalAnalyzer.correlation(
+                            df[cols[i]], df[cols[j]], method
+                        )
+                        corr_matrix[i, j] = result.correlation
+                        corr_matrix[j, i] = result.correlation
+                        pval_matrix[i, j] = result.p_value
+                        pval_matrix[j, i] = result.p_value
+                    except Exception:
+                        corr_matrix[i, j] = np.nan
+                        corr_matrix[j, i] = np.nan
+                        pval_matrix[i, j] = np.nan
+                        pval_matrix[j, i] = np.nan
+
+        return (
+            pd.DataFrame(corr_matrix, index=cols, columns=cols),
+            pd.DataFrame(pval_matrix, index=cols, columns=cols),
+        )
+
+    @staticmethod
+    def compare_groups(
+        group1: np.ndarray | pd.Series,
+        group2: np.ndarray | pd.Series,
+        group1_name: str = "Group 1",
+        group2_name: str = "Group 2",
+    ) -> ComparisonResult:
+        """
+        Compare two groups statistically.
+
+        Args:
+            group1: First group values.
+            group2: Second group values.
+            group1_name: Name for first group.
+            group2_name: Name for second group.
+
+        Returns:
+            ComparisonResult object.
+        """
+        g1 = _drop_nan(group1)
+        g2 = _drop_nan(group2)
+
+        if len(g1) < 2 or len(g2) < 2:
+            raise ValueError("Need at least 2 observations per group")
+
+        # Moments are computed once and shared by the t-test and Cohen's d
+        n1, n2 = len(g1), len(g2)
+        mean1 = g1.mean()
+        mean2 = g2.mean()
+        dev1 = g1 - mean1
+        dev2 = g2 - mean2
+        var1 = np.dot(dev1, dev1) / (n1 - 1)
+        var2 = np.dot(dev2, dev2) / (n2 - 1)
+
+        difference = mean2 - mean1
+        pct_difference = (difference / mean1 * 100) if mean1 != 0 else 0
+
+        # Independent samples t-test
+        t_stat, p_value = stats.ttest_ind_from_stats(
+            mean1, np.sqrt(var1), n1, mean2, np.sqrt(var2), n2, equal_var=True
+        )
+
+        # Cohen's d (effect size)
+        pooled_std = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
+        effect_size = difference / pooled_std if pooled_std != 0 else 0
+
+        return ComparisonResult(
+            group1=group1_name,
+            group2=group2_name,
+            mean1=float(mean1),
+            mean2=float(mean2),
+            difference=float(difference),
+            pct_difference=float(pct_difference),
+            t_statistic=float(t_stat),
+            p_value=float(p_value),
+            is_significant=p_value < 0.05,
+            effect_size=float(effect_size),
+        )
+
+    @staticmethod
+    def anova(groups: dict[str, np.ndarray | pd.Series]) -> dict[str, Any]:
+        """
+        Perform one-way ANOVA.
+
+        Args:
+            groups: Dictionary mapping group names to values.
+
+        Returns:
+            Dictionary with F-statistic, p-value, and group means.
+        """
+        arrays = []
+        group_names = []
+        means = {}
+
+        for name, values in groups.items():
+            arr = _drop_nan(values)
+            if len(arr) >= 2:
+                arrays.append(arr)
+                group_names.append(name)
+                means[name] = float(np.mean(arr))
+
+        if len(arrays) < 2:
+            raise ValueError("Need at least 2 groups with data")
+
+        f_stat, p_value = stats.f_oneway(*arrays)
+
+        return {
+            "f_statistic": float(f_stat),
+            "p_value": float(p_value),
+            "is_significant": p_value < 0.05,
+            "group_means": means,
+            "n_groups": len(arrays),
+        }
+
+    @staticmethod
+    def percentile_rank(
+        value: float | np.ndarray, values: np.ndarray | pd.Series | _Distribution
+    ) -> float | np.ndarray:
+        """
+        Calculate percentile rank of a value within a distribution.
+
+        Matches ``stats.percentileofscore(values, value, kind="rank")``, but
+        sorts the distribution once and ranks any number of values with a
+        binary search.
+
+        Args:
+            value: Value (or array of values) to rank.
+            values: Distribution values, or a distribution from ``_prepared``.
+
+        Returns:
+            Percentile rank (0-100), as an array if ``value`` is an array.
+        """
+        dist = values if isinstance(values, _Distribution) else _prepared(values)
+        scores = np.asarray(value, dtype=np.float64)
+        n = len(dist.sorted)
+
+        if n == 0:
+            ranks = np.full(scores.shape, np.nan)
+        else:
+            left = np.searchsorted(dist.sorted, scores, side="left")
+            right = np.searchsorted(dist.sorted, scores, side="right")
+            ranks = (left + right + (left < right)) * (50.0 / n)
+            # searchsorted places NaN after every value; percentileofscore gives NaN
+            ranks = np.where(np.isnan(scores), np.nan, ranks)
+
+        return float(ranks) if ranks.ndim == 0 else ranks
+
+    @staticmethod
+    def z_score(
+        value: float | np.ndarray, values: np.ndarray | pd.Series | _Distribution
+    ) -> float | np.ndarray:
+        """
+        Calculate z-score of a value.
+
+        Args:
+            value: Value (or array of values) to score.
+            values: Distribution values, or a distribution from ``_prepared``.
+
+        Returns:
+            Z-score, as an array if ``value`` is an array.
+        """
+        dist = values if isinstance(values, _Distribution) else _prepared(values)
+        scores = np.asarray(value, dtype=np.float64)
+        if dist.std != 0:
+            z = (scores - dist.mean) / dist.std
+        else:
+            z = np.zeros(scores.shape)
+        return float(z) if z.ndim == 0 else z
+
+
+def indicator_statistics(
+    indicator: str,
+    year: int | None = None,
+    countries: list[str] | None = None,
+) -> DescriptiveStats:
+    """
+    Get descriptive statistics for an indicator.
+
+    Args:
+        indicator: Indicator code.
+        year: Specific year (or latest if None).
+        countries: List of countries (or all if None).
+
+    Returns:
+        DescriptiveStats object.
+    """
+    if year:
+        df = (
+            QueryBuilder()
+            .select(indicator)
+            .year(year)
+            .execute()
+            .data
+        )
+    else:
+        df = DataQuery.get_latest_values(indicator, countries)
+
+    if df.empty:
+        raise ValueError("No data found")
+
+    return StatisticalAnalyzer.descriptive_stats(df["value"])
+
+
+def correlate_indicators(
+    indicator1: str,
+    indicator2: str,
+    year: int | None = None,
+    method: str = "pearson",
+) -> CorrelationResult:
+    """
+    Calculate correlation between two indicators across countries.
+
+    Args:
+        indicator1: First indicator code.
+        indicator2: Second indicator code.
+        year: Specific year (or latest if None).
+        method: Correlation method.
+
+    Returns:
+        CorrelationResult object.
+    """
+    target_year = year or 2022
+
+    # Fetch both indicators in one query and line them up per country
+    df = (
+        QueryBuilder()
+        .select(indicator1, indicator2)
+        .year(target_year)
+        .with_metadata(False)
+        .execute()
+        .data
+    )
+
+    if df.empty or not {indicator1, indicator2} <= set(df["indicator"]):
+        raise ValueError("No data found for one or both indicators")
+
+    paired = df.pivot_table(
+        index="country",
+        columns="indicator",
+        values="value",
+        aggfunc="first",
+        observed=True,
+    ).dropna()
+
+    if len(paired) < 3:
+        raise ValueError("Not enough paired observations")
+
+    result = StatisticalAnalyzer.correlation(
+        paired[indicator1],
+        paired[indicator2],
+        method,
+    )
+
+    result.indicator1 = indicator1
+    result.indicator2 = indicator2
+
+    return result
+
+
+def compare_regions(
+    indicator: str,
+    year: int | None = None,
+) -> dict[str, Any]:
+    """
+    Compare indicator values across regions using ANOVA.
+
+    Args:
+        indicator: Indicator code.
+        year: Specific year.
+
+    Returns:
+        ANOVA results with regional means.
+    """
+    target_year = year or 2022
+
+    df = (
+        QueryBuilder()
+        .select(indicator)
+        .year(target_year)
+        .execute()
+        .data
+    )
+
+    if df.empty:
+        raise ValueError("No data found")
+
+    # Compare small integer category codes instead of region strings
+    region = df["region"].astype("category")
+    categories = region.cat.categories
+    codes = region.cat.codes.to_numpy()
+    values = df["value"].to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(values)
+
+    groups = {}
+    for k in pd.unique(codes):  # first-appearance order
+        if k < 0:  # missing region
+            continue
+        region_values = values[(codes == k) & present]
+        if len(region_values) >= 2:
+            groups[categories[k]] = region_values
+
+    return StatisticalAnalyzer.anova(groups)
+
+
+def rank_countries(
+    indicator: str,
+    year: int | None = None,
+    ascending: bool = False,
+) -> pd.DataFrame:
+    """
+    Rank countries by indicator value.
+
+    Args:
+        indicator: Indicator code.
+        year: Specific year.
+        ascending: If True, lower values rank higher.
+
+    Returns:
+        DataFrame with rankings.
+    """
+    df = DataQuery.get_latest_values(indicator) if year is None else (
+        QueryBuilder()
+        .select(indicator)
+        .year(year)
+        .execute()
+        .data
+    )
+
+    if df.empty:
+        return pd.DataFrame()
+
+    # Calculate rankings
+    df = df.sort_values("value", ascending=ascending).reset_index(drop=True)
+    df["rank"] = range(1, len(df) + 1)
+
+    # Score every country against the distribution in one vectorized pass,
+    # cleaning and summarising the distribution only once
+    scores = df["value"].to_numpy(dtype=np.float64, na_value=np.nan)
+    missing = np.isnan(scores)
+    dist = _prepared(scores)
+
+    # Calculate percentile
+    df["percentile"] = np.where(
+        missing, np.nan, StatisticalAnalyzer.percentile_rank(scores, dist)
+    )
+
+    # Calculate z-score
+    df["z_score"] = np.where(missing, np.nan, StatisticalAnalyzer.z_score(scores, dist))
+
+    return df[["rank", "country", "country_name", "value", "percentile", "z_score"]]
@@ -0,0 +1,624 @@
+"""
+Data Validation Utilities.
+
+Provides functions for validating and checking data quality:
+- Missing value detection
+- Outlier detection
+- Time series continuity checks
+- Cross-indicator consistency checks
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from open_data.db.connection import session_scope
+from open_data.db.models import Country, Indicator, Observation, utcnow
+
+# Indicators that can legitimately be negative
+NEGATIVE_ALLOWED_INDICATORS = frozenset({
+    "NY.GDP.MKTP.KD.ZG",  # GDP growth
+    "NY.GDP.PCAP.KD.ZG",  # GDP per capita growth
+    "BN.CAB.XOKA.CD",  # Current account
+    "BN.CAB.XOKA.GD.ZS",
+    "GC.BAL.CASH.GD.ZS",  # Fiscal balance
+    "FR.INR.RINR",  # Real interest rate
+    "SP.POP.GROW",  # Population growth
+})
+
+# Number of indicators checked per query in `validate_indicators`
+VALIDATION_CHUNK_SIZE = 50
+
+
+class ValidationSeverity(str, Enum):
+    """Severity levels for validation issues."""
+    INFO = "info"
+    WARNING = "warning"
+    ERROR = "error"
+
+
+@dataclass
+class ValidationIssue:
+    """A single validation issue found in the data."""
+    severity: ValidationSeverity
+    issue_type: str
+    message: str
+    country: str | None = None
+    indicator: str | None = None
+    year: int | None = None
+    value: float | None = None
+    details: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "severity": self.severity.value,
+            "issue_type": self.issue_type,
+            "message": self.message,
+            "country": self.country,
+            "indicator": self.indicator,
+            "year": self.year,
+            "value": self.value,
+            "details": self.details,
+        }
+
+
+@dataclass
+class ValidationReport:
+    """Summary of data validation results."""
+    timestamp: datetime
+    records_checked: int = 0
+    issues: list[ValidationIssue] = field(default_factory=list)
+
+    @property
+    def severity_counts(self) -> Counter[ValidationSeverity]:
+        """Number of issues per severity, counted in a single pass."""
+        return Counter(i.severity for i in self.issues)
+
+    @property
+    def error_count(self) -> int:
+        return self.severity_counts[ValidationSeverity.ERROR]
+
+    @property
+    def warning_count(self) -> int:
+        return self.severity_counts[ValidationSeverity.WARNING]
+
+    @property
+    def info_count(self) -> int:
+        return self.severity_counts[ValidationSeverity.INFO]
+
+    @property
+    def is_valid(self) -> bool:
+        return not any(i.severity == ValidationSeverity.ERROR for i in self.issues)
+
+    def to_dict(self) -> dict:
+        counts = self.severity_counts
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "records_checked": self.records_checked,
+            "error_count": counts[ValidationSeverity.ERROR],
+            "warning_count": counts[ValidationSeverity.WARNING],
+            "info_count": counts[ValidationSeverity.INFO],
+            "is_valid": counts[ValidationSeverity.ERROR] == 0,
+            "issues": [i.to_dict() for i in self.issues],
+        }
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame([i.to_dict() for i in self.issues])
+
+
+class DataValidator:
+    """
+    Validates data quality in the database.
+    """
+
+    def __init__(self, session: Session | None = None):
+        self._session = session
+        self._issues: list[ValidationIssue] = []
+
+    def _add_issue(
+        self,
+        severity: ValidationSeverity,
+        issue_type: str,
+        message: str,
+        **kwargs,
+    ) -> None:
+        """Add a validation issue."""
+        self._issues.append(ValidationIssue(
+            severity=severity,
+            issue_type=issue_type,
+            message=message,
+            **kwargs,
+        ))
+
+    def check_missing_values(
+        self,
+        indicator_code: str,
+        min_coverage: float = 0.5,
+    ) -> list[ValidationIssue]:
+        """
+        Check for countries with too many missing values.
+
+        Args:
+            indicator_code: Indicator to check.
+            min_coverage: Minimum required data coverage (0-1).
+
+        Returns:
+            List of validation issues.
+        """
+        return self.check_missing_values_bulk([indicator_code], min_coverage)
+
+    def check_missing_values_bulk(
+        self,
+        indicator_codes: list[str],
+        min_coverage: float = 0.5,
+    ) -> list[ValidationIssue]:
+        """
+        Check coverage for several indicators with a single query.
+
+        Args:
+            indicator_codes: Indicators to check.
+            min_coverage: Minimum required data coverage (0-1).
+
+        Returns:
+            List of validation issues.
+        """
+        with session_scope() as session:
+            # Total possible years per indicator
+            year_range = (
+                session.query(
+                    Indicator.code.label("code"),
+                    (func.max(Observation.year) - func.min(Observation.year) + 1).label("total_years"),
+                )
+                .join(Observation, Indicator.id == Observation.indicator_id)
+                .filter(Indicator.code.in_(indicator_codes))
+                .group_by(Indicator.code)
+                .subquery()
+            )
+
+            # Countries below the coverage threshold; the comparison stays
+            # fractional so it matches `data_points / total_years < min_coverage`
+            data_points = func.count(Observation.id)
+            low_coverage = (
+                session.query(
+                    Indicator.code,
+                    Country.iso3_code,
+                    Country.name,
+                    data_points.label("data_points"),
+                    year_range.c.total_years,
+                )
+                .join(Observation, Country.id == Observation.country_id)
+                .join(Indicator, Indicator.id == Observation.indicator_id)
+                .join(year_range, year_range.c.code == Indicator.code)
+                .group_by(Indicator.code, Country.id, year_range.c.total_years)
+                .having(data_points < min_coverage * year_range.c.total_years)
+                .order_by(Indicator.code, Country.id)
+                .all()
+            )
+
+        issues = []
+        for code, iso3, name, data_points, total_years in low_coverage:
+            pct = data_points / total_years
+            issues.append(ValidationIssue(
+                severity=ValidationSeverity.WARNING,
+                issue_type="low_coverage",
+                message=f"{name}: Only {pct:.1%} data coverage for {code}",
+                country=iso3,
+                indicator=code,
+                details={"coverage": pct, "data_points": data_points},
+            ))
+
+        return issues
+
+    def check_outliers(
+        self,
+        indicator_code: str,
+        method: str = "zscore",
+        threshold: float = 3.0,
+    ) -> list[ValidationIssue]:
+        """
+        Detect statistical outliers.
+
+        Args:
+            indicator_code: Indicator to check.
+            method: Detection method ('zscore' or 'iqr').
+            threshold: Threshold for outlier detection.
+
+        Returns:
+            List of validation issues for outliers.
+        """
+        return self.check_outliers_bulk([indicator_code], method, threshold)
+
+    def check_outliers_bulk(
+        self,
+        indicator_codes: list[str],
+        method: str = "zscore",
+        threshold: float = 3.0,
+    ) -> list[ValidationIssue]:
+        """
+        Detect statistical outliers for several indicators with a single query.
+
+        Bounds are computed per indicator in the database, so only the
+        outlying rows are transferred.
+
+        Args:
+            indicator_codes: Indicators to check.
+            method: Detection method ('zscore' or 'iqr').
+            threshold: Threshold for outlier detection.
+
+        Returns:
+            List of validation issues for outliers.
+        """
+        if method == "zscore":
+            center = func.avg(Observation.value)
+            spread = func.stddev_samp(Observation.value)
+        elif method == "iqr":
+            center = func.percentile_cont(0.25).within_group(Observation.value)
+            spread = func.percentile_cont(0.75).within_group(Observation.value)
+        else:
+            return []
+
+        with session_scope() as session:
+            # zscore: (mean, std); iqr: (q1, q3)
+            bounds = (
+                session.query(
+                    Indicator.code.label("code"),
+                    center.label("a"),
+                    spread.label("b"),
+                )
+                .join(Observation, Indicator.id == Observation.indicator_id)
+                .filter(Indicator.code.in_(indicator_codes))
+                .group_by(Indicator.code)
+                .subquery()
+            )
+
+            if method == "zscore":
+                lower = bounds.c.a - threshold * bounds.c.b
+                upper = bounds.c.a + threshold * bounds.c.b
+                usable = bounds.c.b > 0
+            else:
+                lower = bounds.c.a - threshold * (bounds.c.b - bounds.c.a)
+                upper = bounds.c.b + threshold * (bounds.c.b - bounds.c.a)
+                usable = bounds.c.a.isnot(None)
+
+            data = (
+                session.query(
+                    Indicator.code,
+                    Country.iso3_code,
+                    Observation.year,
+                    Observation.value,
+                    bounds.c.a,
+                    bounds.c.b,
+                )
+                .join(Observation, Country.id == Observation.country_id)
+                .join(Indicator, Indicator.id == Observation.indicator_id)
+                .join(bounds, bounds.c.code == Indicator.code)
+                .filter(usable)
+                .filter(or_(Observation.value < lower, Observation.value > upper))
+                .order_by(Indicator.code, Observation.country_id, Observation.year)
+                .all()
+            )
+
+        if not data:
+            return []
+
+        # Transpose the rows straight into columns; the numeric ones
+        # become float64 arrays
+        indicators, countries, years, values, a, b = zip(*data)
+        values = np.array(values, dtype=np.float64)
+        a = np.array(a, dtype=np.float64)
+        b = np.array(b, dtype=np.float64)
+
+        if method == "zscore":
+            zscores = (values - a) / b
+            return [
+                ValidationIssue(
+                    severity=ValidationSeverity.WARNING,
+                    issue_type="outlier",
+                    message=f"Outlier detected: {c} {y} = {v:.2f} (z={z:.2f})",
+                    country=c,
+                    indicator=code,
+                    year=int(y),
+                    value=float(v),
+                    details={"zscore": float(z)},
+                )
+                for code, c, y, v, z in zip(indicators, countries, years, values, zscores)
+            ]
+
+        iqr = b - a
+        lowers = a - threshold * iqr
+        uppers = b + threshold * iqr
+        return [
+            ValidationIssue(
+                severity=ValidationSeverity.WARNING,
+                issue_type="outlier",
+                message=f"Outlier detected: {c} {y} = {v:.2f}",
+                country=c,
+                indicator=code,
+                year=int(y),
+                value=float(v),
+                details={"bounds": [lo, hi]},
+            )
+            for code, c, y, v, lo, hi in zip(indicators, countries, years, values, lowers, uppers)
+        ]
+
+    def check_time_series_gaps(
+        self,
+        indicator_code: str,
+        max_gap_years: int = 3,
+    ) -> list[ValidationIssue]:
+        """
+        Check for gaps in time series data.
+
+        Args:
+            indicator_code: Indicator to check.
+            max_gap_years: Maximum acceptable gap in years.
+
+        Returns:
+            List of validation issues for gaps.
+        """
+        return self.check_time_series_gaps_bulk([indicator_code], max_gap_years)
+
+    def check_time_series_gaps_bulk(
+        self,
+        indicator_codes: list[str],
+        max_gap_years: int = 3,
+    ) -> list[ValidationIssue]:
+        """
+        Check for time series gaps in several indicators with a single query.
+
+        Each year is paired with the next one in the database, so only the
+        gaps themselves are transferred.
+
+        Args:
+            indicator_codes: Indicators to check.
+            max_gap_years: Maximum acceptable gap in years.
+
+        Returns:
+            List of validation issues for gaps.
+        """
+        next_year = func.lead(Observation.year).over(
+            partition_by=(Observation.indicator_id, Observation.country_id),
+            order_by=Observation.year,
+        )
+
+        with session_scope() as session:
+            pairs = (
+                session.query(
+                    Observation.indicator_id,
+                    Observation.country_id,
+                    Observation.year.label("year"),
+                    next_year.label("next_year"),
+                )
+                .join(Indicator, Indicator.id == Observation.indicator_id)
+                .filter(Indicator.code.in_(indicator_codes))
+                .subquery()
+            )
+
+            gaps = (
+                session.query(
+                    Indicator.code,
+                    Country.iso3_code,
+                    Country.name,
+                    pairs.c.year,
+                    pairs.c.next_year,
+                )
+                .join(pairs, Country.id == pairs.c.country_id)
+                .join(Indicator, Indicator.id == pairs.c.indicator_id)
+                .filter(pairs.c.next_year - pairs.c.year > max_gap_years)
+                .order_by(Indicator.code, Country.id, pairs.c.year)
+                .all()
+            )
+
+        return [
+            ValidationIssue(
+                severity=ValidationSeverity.INFO,
+                issue_type="time_gap",
+                message=f"{name}: {to_year - from_year}-year gap ({from_year}-{to_year})",
+                country=iso3,
+                indicator=code,
+                year=from_year,
+                details={
+                    "gap_years": to_year - from_year,
+                    "from_year": from_year,
+                    "to_year": to_year,
+                },
+            )
+            for code, iso3, name, from_year, to_year in gaps
+        ]
+
+    def check_negative_values(
+        self,
+        indicator_code: str,
+        allow_negative: bool = False,
+    ) -> list[ValidationIssue]:
+        """
+        Check for unexpected negative values.
+
+        Args:
+            indicator_code: Indicator to check.
+            allow_negative: Whether negatives are expected.
+
+        Returns:
+            List of validation issues.
+        """
+        if allow_negative:
+            return []
+
+        return self.check_negative_values_bulk([indicator_code])
+
+    def check_negative_values_bulk(self, indicator_codes: list[str]) -> list[ValidationIssue]:
+        """
+        Check several indicators for unexpected negative values with a single query.
+
+        Indicators that can legitimately be negative are skipped.
+
+        Args:
+            indicator_codes: Indicators to check.
+
+        Returns:
+            List of validation issues.
+        """
+        codes = [c for c in indicator_codes if c not in NEGATIVE_ALLOWED_INDICATORS]
+        if not codes:
+            return []
+
+        with session_scope() as session:
+            negatives = (
+                session.query(
+                    Indicator.code,
+                    Country.iso3_code,
+                    Observation.year,
+                    Observation.value,
+                )
+                .join(Observation, Country.id == Observation.country_id)
+                .join(Indicator, Indicator.id == Observation.indicator_id)
+                .filter(Indicator.code.in_(codes))
+                .filter(Observation.value < 0)
+                .order_by(Indicator.code, Observation.country_id, Observation.year)
+                .all()
+            )
+
+        return [
+            ValidationIssue(
+                severity=ValidationSeverity.WARNING,
+                issue_type="negative_value",
+                message=f"Unexpected negative: {iso3} {year} = {value}",
+                country=iso3,
+                indicator=code,
+                year=year,
+                value=float(value),
+            )
+            for code, iso3, year, value in negatives
+        ]
+
+    def validate_indicators(
+        self,
+        indicator_codes: list[str],
+        checks: list[str] | None = None,
+    ) -> ValidationReport:
+        """
+        Run validation checks on several indicators.
+
+        Indicators are checked in chunks of `VALIDATION_CHUNK_SIZE`, one
+        query per check and chunk. Issues are reported grouped by indicator,
+        in the order the codes were given.
+
+        Args:
+            indicator_codes: Indicators to validate.
+            checks: List of checks to run. If None, run all.
+
+        Returns:
+            ValidationReport with all issues.
+        """
+        report = ValidationReport(timestamp=utcnow())
+
+        all_checks = checks or ["missing", "outliers", "gaps", "negative"]
+
+        codes = list(dict.fromkeys(indicator_codes))
+        position = {code: i for i, code in enumerate(codes)}
+
+        for start in range(0, len(codes), VALIDATION_CHUNK_SIZE):
+            chunk = codes[start:start + VALIDATION_CHUNK_SIZE]
+            issues = []
+
+            if "missing" in all_checks:
+                issues.extend(self.check_missing_values_bulk(chunk))
+
+            if "outliers" in all_checks:
+                issues.extend(self.check_outliers_bulk(chunk))
+
+            if "gaps" in all_checks:
+                issues.extend(self.check_time_series_gaps_bulk(chunk))
+
+            if "negative" in all_checks:
+                issues.extend(self.check_negative_values_bulk(chunk))
+
+            # Stable, so each indicator keeps the order of the checks
+            issues.sort(key=lambda issue: position[issue.indicator])
+            report.issues.extend(issues)
+
+        return report
+
+    def validate_indicator(
+        self,
+        indicator_code: str,
+        checks: list[str] | None = None,
+    ) -> ValidationReport:
+        """
+        Run all validation checks on an indicator.
+
+        Args:
+            indicator_code: Indicator to validate.
+            checks: List of checks to run. If None, run all.
+
+        Returns:
+            ValidationReport with all issues.
+        """
+        return self.validate_indicators([indicator_code], checks)
+
+    def get_data_quality_summary(self) -> pd.DataFrame:
+        """
+        Get a summary of data quality across all indicators.
+
+        Returns:
+            DataFrame with quality metrics per indicator.
+        """
+        with session_scope() as session:
+            summary = (
+                session.query(
+                    Indicator.code,
+                    Indicator.name,
+                    func.count(Observation.id).label("total_obs"),
+                    func.count(func.distinct(Observation.country_id)).label("countries"),
+                    func.min(Observation.year).label("min_year"),
+                    func.max(Observation.year).label("max_year"),
+                    func.avg(Observation.value).label("mean_value"),
+                )
+                .join(Observation, Indicator.id == Observation.indicator_id)
+                .group_by(Indicator.code, Indicator.name)
+                .all()
+            )
+
+            return pd.DataFrame(summary, columns=[
+                "code", "name", "observations", "countries",
+                "min_year", "max_year", "mean_value"
+            ])
+
+
+def validate_data(
+    indicator_code: str | None = None,
+    checks: list[str] | None = None,
+) -> ValidationReport:
+    """
+    Run data validation.
+
+    Args:
+        indicator_code: Specific indicator to validate (or None for all).
+        checks: List of checks to run.
+
+    Returns:
+        ValidationReport with results.
+    """
+    validator = DataValidator()
+
+    if indicator_code:
+        return validator.validate_indicator(indicator_code, checks)
+
+    # Validate all indicators
+    with session_scope() as session:
+        codes = list(dict.fromkeys(code for (code,) in session.query(Indicator.code).all()))
+
+    return validator.validate_indicators(codes, checks)
+
+
+def get_quality_summary() -> pd.DataFrame:
+    """Get data quality summary for all indicators."""
+    validator = DataValidator()
+    return validator.get_data_quality_summary()
@@ -0,0 +1,31 @@
+"""
+Database package for Open Data Platform.
+"""
+
+from open_data.db.connection import get_engine, get_session, init_db
+from open_data.db.models import (
+    Base,
+    Category,
+    Country,
+    Indicator,
+    IndicatorGroup,
+    IndicatorGroupMember,
+    IngestionLog,
+    Observation,
+    Source,
+)
+
+__all__ = [
+    "Base",
+    "Country",
+    "Source",
+    "Category",
+    "Indicator",
+    "Observation",
+    "IngestionLog",
+    "IndicatorGroup",
+    "IndicatorGroupMember",
+    "get_engine",
+    "get_session",
+    "init_db",
+]
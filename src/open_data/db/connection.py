@@ -0,0 +1,237 @@
+"""
+Database connection management for Open Data Platform.
+"""
+
+from contextlib import contextmanager
+from typing import Generator
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from open_data.config import settings
+from open_data.db.models import Base
+
+# Global engine instances
+_engine: Engine | None = None
+_read_engine: Engine | None = None
+_SessionLocal: sessionmaker[Session] | None = None
+
+# Tables reported by get_table_stats, and its statements, built once so
+# every call sends the same SQL text
+_STATS_TABLES = ("countries", "sources", "categories", "indicators", "observations")
+
+# One round trip for all tables
+_TABLE_COUNT_SQL = text("\nUNION ALL\n".join(
+    f"SELECT '{table}' AS table_name, COUNT(*) AS row_count FROM {table}"
+    for table in _STATS_TABLES
+))
+
+# Partitioned tables hold no rows themselves; add up their partitions
+_TABLE_ESTIMATE_SQL = text(
+    "SELECT t AS table_name, ("
+    "SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint FROM pg_class c "
+    "WHERE (c.oid = to_regclass(t) AND c.relkind <> 'p') "
+    "OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass(t))"
+    ") AS row_count FROM unnest(CAST(:tables AS text[])) AS t"
+)
+
+
+def get_engine(echo: bool = False) -> Engine:
+    """
+    Get or create the SQLAlchemy engine.
+
+    Bulk writes should pass a list of dicts, e.g.
+    ``session.execute(insert(Observation), rows)``, so psycopg2 can send
+    them as multi-row INSERT statements instead of one per row.
+
+    Connections are not pinged on checkout, which would cost a round trip
+    per session on the ingestion path; recycling them every 30 minutes
+    keeps them from going stale instead.
+
+    Args:
+        echo: If True, log all SQL statements.
+
+    Returns:
+        SQLAlchemy Engine instance.
+    """
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            settings.database_url,
+            echo=echo,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_use_lifo=True,
+            pool_recycle=1800,
+            query_cache_size=1200,
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=1000,
+            executemany_batch_page_size=500,
+        )
+    return _engine
+
+
+def get_read_engine() -> Engine:
+    """
+    Get or create the engine for interactive reads.
+
+    Pings each connection on checkout, trading a round trip for never
+    handing a dead connection to a status or ad-hoc query. These reads are
+    occasional, so the engine gets its own small pool rather than a second
+    copy of the ingestion pool.
+
+    Returns:
+        SQLAlchemy Engine instance.
+    """
+    global _read_engine
+    if _read_engine is None:
+        _read_engine = create_engine(
+            settings.database_url,
+            pool_size=settings.db_read_pool_size,
+            max_overflow=settings.db_read_max_overflow,
+            pool_use_lifo=True,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            query_cache_size=1200,
+        )
+    return _read_engine
+
+
+def warm_pool() -> None:
+    """
+    Open `pool_size` connections up front and return them to the pool.
+
+    Later requests then reuse established connections instead of paying
+    the connect and authentication round trips themselves.
+    """
+    engine = get_engine()
+    connections = [engine.connect() for _ in range(engine.pool.size())]
+    for conn in connections:
+        conn.close()
+
+
+def get_session_factory() -> sessionmaker[Session]:
+    """Get the session factory."""
+    global _SessionLocal
+    if _SessionLocal is None:
+        _SessionLocal = sessionmaker(
+            bind=get_engine(),
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _SessionLocal
+
+
+def get_session() -> Generator[Session, None, None]:
+    """
+    Get a database session as a generator (for dependency injection).
+
+    Yields:
+        SQLAlchemy Session.
+    """
+    session_factory = get_session_factory()
+    session = session_factory()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@contextmanager
+def session_scope() -> Generator[Session, None, None]:
+    """
+    Provide a transactional scope around a series of operations.
+
+    Usage:
+        with session_scope() as session:
+            session.add(obj)
+            # auto-commits on success, auto-rollbacks on exception
+    """
+    session_factory = get_session_factory()
+    session = session_factory()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def init_db(drop_existing: bool = False) -> None:
+    """
+    Initialize the database schema.
+
+    Note: For production, the init.sql script handles schema creation
+    with partitioning. This function is mainly for testing or
+    simple setups without partitioning.
+
+    Args:
+        drop_existing: If True, drop all tables before creating.
+    """
+    engine = get_engine()
+
+    if drop_existing:
+        Base.metadata.drop_all(bind=engine)
+
+    Base.metadata.create_all(bind=engine)
+    warm_pool()
+
+
+def check_connection() -> bool:
+    """
+    Check if the database connection is working.
+
+    Returns:
+        True if connection is successful, False otherwise.
+    """
+    try:
+        engine = get_read_engine()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
+
+
+def get_table_stats(approximate: bool = False) -> dict[str, int]:
+    """
+    Get row counts for main tables.
+
+    Args:
+        approximate: If True, read the planner's row estimates from
+            pg_class instead of counting, which takes constant time but is
+            only as fresh as the last VACUUM/ANALYZE.
+
+    Returns:
+        Dictionary mapping table names to row counts.
+    """
+    engine = get_read_engine()
+
+    if approximate:
+        sql, params = _TABLE_ESTIMATE_SQL, {"tables": list(_STATS_TABLES)}
+    else:
+        sql, params = _TABLE_COUNT_SQL, {}
+
+    with engine.connect() as conn:
+        stats = {row.table_name: row.row_count for row in conn.execute(sql, params)}
+
+    return {table: stats.get(table, 0) for table in _STATS_TABLES}
+
+
+def execute_raw_sql(sql: str) -> list[dict]:
+    """
+    Execute raw SQL and return results as list of dicts.
+
+    Args:
+        sql: SQL query to execute.
+
+    Returns:
+        List of dictionaries representing rows.
+    """
+    engine = get_read_engine()
+    with engine.connect() as conn:
+        return [dict(row) for row in conn.execute(text(sql)).mappings()]
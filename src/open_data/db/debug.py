@@ -0,0 +1,50 @@
+"""
+Debugging helpers for database access patterns.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Generator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+from open_data.db.connection import get_engine
+
+
+@contextmanager
+def count_queries(
+    bind: Engine | Connection | None = None,
+) -> Generator[list[str], None, None]:
+    """
+    Record every SQL statement executed on a connection or engine.
+
+    Useful for catching N+1 patterns, e.g.:
+
+        with count_queries() as queries:
+            DataQuery.get_latest_values("NY.GDP.MKTP.CD")
+        assert len(queries) <= 3
+
+    Args:
+        bind: Engine or connection to watch. Defaults to the global engine.
+
+    Yields:
+        List that collects the SQL text of each statement as it runs.
+    """
+    target = bind if bind is not None else get_engine()
+    queries: list[str] = []
+
+    def before_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        queries.append(statement)
+
+    event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(target, "before_cursor_execute", before_cursor_execute)
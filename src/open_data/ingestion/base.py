@@ -0,0 +1,740 @@
+"""
+Base classes for data ingestion.
+"""
+
+import io
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+import pandas as pd
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from open_data.config import COUNTRY_CODES, COUNTRY_CODES_SET, DataSource
+from open_data.db.connection import session_scope
+from open_data.db.models import (
+    Category,
+    Country,
+    Indicator,
+    IngestionLog,
+    Observation,
+    Source,
+    utcnow,
+)
+
+# Upper bound for rows written per batch; larger batches stop paying off on
+# PostgreSQL and only grow memory use and transaction size
+MAX_BATCH_SIZE = 10_000
+
+# Errors kept on an IngestionResult
+MAX_ERRORS = 100
+
+# HTTP requests a collector keeps in flight at once; low enough to stay
+# within the public APIs' rate limits
+MAX_CONCURRENT_REQUESTS = 6
+
+# Compact dtypes for the DataFrames returned by fetch_data: a handful of
+# distinct country/indicator codes repeated across many rows, and years that
+# fit in 16 bits. Values stay float64 so large series keep their precision.
+FETCH_DTYPES = {"country": "category", "indicator": "category", "year": "int16"}
+
+# Batch size from which upsert_observations loads a batch through COPY into
+# a staging table instead of an INSERT; below this the staging overhead does
+# not pay off
+COPY_UPSERT_THRESHOLD = 5_000
+
+# Observation columns written by BaseCollector._copy_observations
+_OBSERVATION_COPY_COLUMNS = (
+    "country_id",
+    "indicator_id",
+    "year",
+    "value",
+    "is_estimated",
+    "source_note",
+    "fetched_at",
+)
+
+# Per-connection staging table for COPY-based upserts; seq preserves input
+# order so the last row for a key wins, as in the INSERT path
+_STAGING_TABLE_SQL = text("""
+    CREATE TEMP TABLE IF NOT EXISTS observations_staging (
+        seq BIGSERIAL,
+        country_id INTEGER NOT NULL,
+        indicator_id INTEGER NOT NULL,
+        year INTEGER NOT NULL,
+        value DOUBLE PRECISION,
+        is_estimated BOOLEAN,
+        source_note TEXT,
+        fetched_at TIMESTAMP
+    ) ON COMMIT DELETE ROWS
+""")
+
+_STAGING_MERGE_SQL = text("""
+    INSERT INTO observations
+        (country_id, indicator_id, year, value, is_estimated, source_note, fetched_at)
+    SELECT DISTINCT ON (country_id, indicator_id, year)
+        country_id, indicator_id, year, value, is_estimated, source_note, fetched_at
+    FROM observations_staging
+    ORDER BY country_id, indicator_id, year, seq DESC
+    ON CONFLICT (country_id, indicator_id, year) DO UPDATE SET
+        value = EXCLUDED.value,
+        is_estimated = EXCLUDED.is_estimated,
+        fetched_at = EXCLUDED.fetched_at
+""")
+
+
+def _copy_field(value: Any) -> str:
+    """Format a value for PostgreSQL's COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+@dataclass
+class IngestionResult:
+    """Result of a data ingestion operation."""
+
+    source: str
+    started_at: datetime
+    completed_at: datetime | None = None
+    status: str = "running"
+    records_processed: int = 0
+    records_failed: int = 0
+    # Only the most recent errors are kept, so a source that fails on every
+    # record cannot grow this without bound
+    errors: deque[str] = field(default_factory=lambda: deque(maxlen=MAX_ERRORS))
+
+    @property
+    def duration_seconds(self) -> float | None:
+        """Calculate duration in seconds."""
+        if self.completed_at:
+            return (self.completed_at - self.started_at).total_seconds()
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "source": self.source,
+            "started_at": self.started_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "status": self.status,
+            "records_processed": self.records_processed,
+            "records_failed": self.records_failed,
+            "duration_seconds": self.duration_seconds,
+            "errors": list(self.errors),
+        }
+
+
+class BaseCollector(ABC):
+    """
+    Abstract base class for data collectors.
+
+    All data source collectors should inherit from this class
+    and implement the required methods.
+    """
+
+    source_code: DataSource
+    source_name: str
+    base_url: str
+
+    # Rows written (and committed) per batch, capped at MAX_BATCH_SIZE
+    batch_size: int = MAX_BATCH_SIZE
+
+    # Category codes for new indicators, in order of preference (the first
+    # one present in the database is used), and their unit
+    indicator_categories: tuple[str, ...] = ()
+    indicator_unit: str | None = None
+
+    # Timestamp shared by the rows of the batch being written
+    _batch_ts: datetime | None = None
+
+    # Primary keys of dimension rows, shared by all collectors in the
+    # process: {"source": {code: id}, "country": {iso3: id},
+    # "indicator": {(source_id, code): id}}
+    _id_cache: dict[str, dict[Any, int]] = {}
+
+    def __init__(
+        self,
+        countries: list[str] | None = None,
+        start_year: int = 1960,
+        end_year: int | None = None,
+    ):
+        """
+        Initialize the collector.
+
+        Args:
+            countries: List of ISO3 country codes. If None, use all configured countries.
+            start_year: First year to collect data for.
+            end_year: Last year to collect data for. If None, use current year.
+        """
+        self.countries = countries or COUNTRY_CODES
+        self.start_year = start_year
+        self.end_year = end_year or datetime.now().year
+        self._validate_countries()
+
+    def _validate_countries(self) -> None:
+        """Validate that all country codes are valid."""
+        if self.countries is COUNTRY_CODES:
+            return
+        invalid = {c for c in self.countries if c not in COUNTRY_CODES_SET}
+        if invalid:
+            raise ValueError(f"Invalid country codes: {invalid}")
+
+    def get_or_create_source(self, session: Session) -> Source:
+        """
+        Get or create the source record in the database.
+
+        The source's primary key is cached after the first lookup, so
+        later runs load it by id.
+
+        Args:
+            session: SQLAlchemy session.
+
+        Returns:
+            Source model instance.
+        """
+        code = self.source_code.value
+        source_ids = self._id_cache.setdefault("source", {})
+
+        source = None
+        if code in source_ids:
+            source = session.get(Source, source_ids[code])
+
+        if source is None:
+            source = session.scalar(select(Source).filter_by(code=code))
+        if source is None:
+            source = Source(
+                code=code,
+                name=self.source_name,
+                base_url=self.base_url,
+            )
+            session.add(source)
+            session.flush()
+
+        source_ids[code] = source.id
+        return source
+
+    def _get_country_map(self, session: Session) -> dict[str, int]:
+        """
+        Get mapping of ISO3 codes to country IDs.
+
+        Loaded with a single query on first use and cached for the process;
+        the returned dict must not be modified.
+        """
+        countries = self._id_cache.get("country")
+        if countries is None:
+            countries = dict(session.execute(select(Country.iso3_code, Country.id)).all())
+            self._id_cache["country"] = countries
+        return countries
+
+    def _load_indicator_ids(self, session: Session, source_id: int) -> None:
+        """Cache the IDs of every indicator of a source."""
+        rows = session.execute(
+            select(Indicator.code, Indicator.id).where(Indicator.source_id == source_id)
+        ).all()
+        self._id_cache.setdefault("indicator", {}).update(
+            ((source_id, code), indicator_id) for code, indicator_id in rows
+        )
+
+    def _create_indicators(
+        self,
+        session: Session,
+        source: Source,
+        names: Mapping[str, str],
+    ) -> dict[str, int]:
+        """
+        Insert indicators in one statement.
+
+        New indicators get the first of `indicator_categories` that exists
+        and `indicator_unit`, with annual frequency.
+
+        Args:
+            session: SQLAlchemy session.
+            source: Source the indicators belong to.
+            names: Code to display name of indicators that do not exist yet.
+
+        Returns:
+            Indicator code to ID of the inserted indicators.
+        """
+        categories = dict(session.execute(
+            select(Category.code, Category.id).where(Category.code.in_(self.indicator_categories))
+        ).all())
+        category_id = next(
+            (categories[code] for code in self.indicator_categories if code in categories),
+            None,
+        )
+        rows = session.execute(
+            insert(Indicator).returning(Indicator.code, Indicator.id),
+            [
+                {
+                    "source_id": source.id,
+                    "category_id": category_id,
+                    "code": code,
+                    "name": name[:255],
+                    "unit": self.indicator_unit,
+                    "frequency": "annual",
+                }
+                for code, name in names.items()
+            ],
+        ).all()
+        # Not cached: the IDs only exist once the caller's transaction commits
+        return dict(rows)
+
+    def _get_indicator_map(
+        self,
+        session: Session,
+        source: Source,
+        names: Mapping[str, str],
+    ) -> dict[str, int]:
+        """
+        Map indicator codes to IDs, creating indicators that do not exist.
+
+        Known indicators are resolved with one query for the whole source,
+        and all new codes are inserted together by `_create_indicators`.
+
+        Args:
+            session: SQLAlchemy session.
+            source: Source the indicators belong to.
+            names: Indicator code to display name.
+
+        Returns:
+            Indicator code to indicator ID.
+        """
+        known = self._id_cache.setdefault("indicator", {})
+        if any((source.id, code) not in known for code in names):
+            self._load_indicator_ids(session, source.id)
+
+        indicator_map = {code: known.get((source.id, code)) for code in names}
+        missing = {code: name for code, name in names.items() if indicator_map[code] is None}
+        if missing:
+            indicator_map.update(self._create_indicators(session, source, missing))
+        return indicator_map
+
+    def _observation_records(
+        self,
+        df: pd.DataFrame,
+        country_map: dict[str, int],
+        indicator_map: dict[str, int],
+    ) -> list[dict[str, Any]]:
+        """
+        Convert fetched data into observation rows for `upsert_observations`.
+
+        Country and indicator codes are mapped to IDs column-wise; rows
+        whose country or indicator is unknown are dropped.
+
+        Args:
+            df: DataFrame with country, indicator, year and value columns.
+            country_map: ISO3 code to country ID.
+            indicator_map: Indicator code to indicator ID.
+
+        Returns:
+            Dicts with country_id, indicator_id, year and value, with
+            values passed as plain floats and missing values as None.
+        """
+        mapped = df.assign(
+            country_id=df["country"].map(country_map),
+            indicator_id=df["indicator"].map(indicator_map),
+        ).dropna(subset=["country_id", "indicator_id"])
+        mapped = mapped.astype({"country_id": "int64", "indicator_id": "int64", "year": "int64"})
+        value = mapped["value"].astype("float64")
+        mapped["value"] = value.astype(object).where(value.notna(), None)
+        return mapped[["country_id", "indicator_id", "year", "value"]].to_dict("records")
+
+    def create_ingestion_log(self, session: Session, source: Source) -> IngestionLog:
+        """
+        Create an ingestion log entry.
+
+        Args:
+            session: SQLAlchemy session.
+            source: Source model instance.
+
+        Returns:
+            IngestionLog model instance.
+        """
+        log = IngestionLog(
+            source_id=source.id,
+            started_at=utcnow(),
+            status="running",
+        )
+        session.add(log)
+        session.flush()
+        return log
+
+    def update_ingestion_log(
+        self,
+        session: Session,
+        log: IngestionLog,
+        result: IngestionResult,
+    ) -> None:
+        """
+        Update the ingestion log with results.
+
+        Args:
+            session: SQLAlchemy session.
+            log: IngestionLog model instance.
+            result: IngestionResult with operation details.
+        """
+        log.completed_at = result.completed_at
+        log.status = result.status
+        log.records_processed = result.records_processed
+        if result.errors:
+            log.error_message = "\n".join(islice(result.errors, 10))  # Keep first 10 errors
+        session.flush()
+
+    def close(self) -> None:
+        """Close the collector's HTTP client, if it has one."""
+        client = getattr(self, "client", None)
+        if client is not None:
+            client.close()
+
+    def __enter__(self) -> "BaseCollector":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _fetch_concurrently(
+        self,
+        fetch: Callable[[Any], Any],
+        items: Iterable[Any],
+    ) -> list[Any]:
+        """
+        Call `fetch` for each item on a small thread pool.
+
+        Requests are network-bound, so overlapping them cuts wall time
+        roughly by the number of workers. `fetch` must be safe to call from
+        several threads; httpx.Client is.
+
+        Args:
+            fetch: Function making one request per item.
+            items: Arguments for `fetch`.
+
+        Returns:
+            Results of `fetch`, in the order of `items`.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [fetch(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(len(items), MAX_CONCURRENT_REQUESTS)) as pool:
+            return list(pool.map(fetch, items))
+
+    def _iter_concurrently(
+        self,
+        fetch: Callable[[Any], Any],
+        items: Iterable[Any],
+    ) -> Iterator[Any]:
+        """
+        Call `fetch` for each item on a thread pool, yielding results as they complete.
+
+        At most MAX_CONCURRENT_REQUESTS calls are in flight, so while the
+        caller processes one result (e.g. writes it to the database) the
+        next requests are already running, and unconsumed results never
+        pile up in memory.
+
+        Args:
+            fetch: Function making one request per item; must be thread-safe.
+            items: Arguments for `fetch`; consumed lazily.
+
+        Yields:
+            Results of `fetch`, in completion order.
+        """
+        items = iter(items)
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as pool:
+            pending = {pool.submit(fetch, item) for item in islice(items, MAX_CONCURRENT_REQUESTS)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.update(pool.submit(fetch, item) for item in islice(items, 1))
+                    yield future.result()
+
+    def _iter_batches(
+        self,
+        iterable: Iterable[Any],
+        size: int | None = None,
+    ) -> Iterator[list[Any]]:
+        """
+        Split an iterable into lists of at most `size` items.
+
+        Args:
+            iterable: Items to batch; consumed lazily.
+            size: Batch size. Defaults to `batch_size`, capped at MAX_BATCH_SIZE.
+
+        Yields:
+            Lists of items. `_batch_ts` holds the timestamp for the
+            current batch.
+        """
+        size = max(1, min(size or self.batch_size, MAX_BATCH_SIZE))
+        iterator = iter(iterable)
+        while batch := list(islice(iterator, size)):
+            # One timestamp for every row in the batch
+            self._batch_ts = utcnow()
+            yield batch
+
+    def upsert_observations(
+        self,
+        session: Session,
+        rows: Iterable[dict[str, Any]],
+        commit: bool = False,
+    ) -> int:
+        """
+        Insert observations, updating rows that already exist.
+
+        Uses INSERT ... ON CONFLICT DO UPDATE on (country_id, indicator_id,
+        year), executed once per batch of `batch_size` rows, so no
+        existence check is needed before writing. Batches of at least
+        COPY_UPSERT_THRESHOLD rows are loaded with COPY and merged in one
+        statement instead. Each batch is written as soon as it is full, so
+        a lazy `rows` iterable overlaps fetching with writing.
+
+        Args:
+            session: SQLAlchemy session.
+            rows: Observation dicts keyed by column name.
+            commit: Commit the session after each batch, so a long load
+                never holds one open transaction.
+
+        Returns:
+            Number of rows written.
+        """
+        stmt = insert(Observation.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["country_id", "indicator_id", "year"],
+            set_={
+                "value": stmt.excluded.value,
+                "is_estimated": stmt.excluded.is_estimated,
+                "fetched_at": stmt.excluded.fetched_at,
+            },
+        )
+
+        count = 0
+        for batch in self._iter_batches(rows):
+            if len(batch) >= COPY_UPSERT_THRESHOLD:
+                count += self._copy_upsert_observations(session, batch)
+            else:
+                # A statement cannot update the same row twice; keep the last one
+                unique = {
+                    (row["country_id"], row["indicator_id"], row["year"]): {
+                        "value": None,
+                        "is_estimated": False,
+                        "source_note": None,
+                        "fetched_at": self._batch_ts,
+                        **row,
+                    }
+                    for row in batch
+                }
+                session.execute(stmt, list(unique.values()))
+                count += len(unique)
+
+            if commit:
+                session.commit()
+
+        return count
+
+    def _copy_upsert_observations(
+        self,
+        session: Session,
+        rows: Iterable[dict[str, Any]],
+    ) -> int:
+        """
+        Upsert observations by COPYing them into a staging table first.
+
+        COPY avoids parsing and planning an INSERT per batch; a single
+        INSERT ... SELECT ... ON CONFLICT then merges the staged rows.
+
+        Args:
+            session: SQLAlchemy session.
+            rows: Observation dicts keyed by column name.
+
+        Returns:
+            Number of observations inserted or updated.
+        """
+        session.execute(_STAGING_TABLE_SQL)
+        self._copy_observations(session, rows, table="observations_staging")
+        merged = session.execute(_STAGING_MERGE_SQL).rowcount
+        session.execute(text("TRUNCATE observations_staging"))
+        return merged
+
+    def _copy_observations(
+        self,
+        session: Session,
+        rows: Iterable[dict[str, Any]],
+        table: str = "observations",
+    ) -> int:
+        """
+        Bulk load observation records with PostgreSQL COPY.
+
+        Rows are streamed over the session's own connection, so they are
+        part of the surrounding transaction. Missing optional fields fall
+        back to the model defaults.
+
+        Args:
+            session: SQLAlchemy session.
+            rows: Observation dicts keyed by column name.
+            table: Table to load, e.g. a staging table with the same columns.
+
+        Returns:
+            Number of rows written.
+        """
+        now = utcnow()
+        columns = ", ".join(_OBSERVATION_COPY_COLUMNS)
+        sql = f"COPY {table} ({columns}) FROM STDIN"
+
+        records = (
+            (
+                row["country_id"],
+                row["indicator_id"],
+                row["year"],
+                row.get("value"),
+                row.get("is_estimated", False),
+                row.get("source_note"),
+                row.get("fetched_at") or now,
+            )
+            for row in rows
+        )
+
+        count = 0
+        cursor = session.connection().connection.cursor()
+        try:
+            if hasattr(cursor, "copy"):
+                # psycopg 3
+                with cursor.copy(sql) as copy:
+                    for record in records:
+                        copy.write_row(record)
+                        count += 1
+            else:
+                # psycopg2 needs a file-like source; buffer at most
+                # batch_size rows per COPY to bound memory use
+                size = max(1, min(self.batch_size, MAX_BATCH_SIZE))
+                while chunk := list(islice(records, size)):
+                    buffer = io.StringIO()
+                    for record in chunk:
+                        buffer.write("\t".join(map(_copy_field, record)))
+                        buffer.write("\n")
+                    buffer.seek(0)
+                    cursor.copy_expert(sql, buffer)
+                    count += len(chunk)
+        finally:
+            cursor.close()
+
+        return count
+
+    @abstractmethod
+    def fetch_indicators(self) -> list[dict[str, Any]]:
+        """
+        Fetch available indicators from the data source.
+
+        Returns:
+            List of indicator definitions.
+        """
+        pass
+
+    @abstractmethod
+    def fetch_data(
+        self,
+        indicators: list[str],
+        countries: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch data for specified indicators and countries.
+
+        Args:
+            indicators: List of indicator codes to fetch.
+            countries: List of country codes. If None, use all configured.
+
+        Returns:
+            List of observation records.
+        """
+        pass
+
+    @abstractmethod
+    def collect(
+        self,
+        indicators: list[str] | None = None,
+        countries: list[str] | None = None,
+    ) -> IngestionResult:
+        """
+        Run the full collection process.
+
+        This method should:
+        1. Fetch indicators if not specified
+        2. Fetch data for all indicators and countries
+        3. Store data in the database
+        4. Return an IngestionResult with status
+
+        Args:
+            indicators: Optional list of indicator codes. If None, fetch all.
+            countries: Optional list of country codes. If None, use all configured.
+
+        Returns:
+            IngestionResult with operation status and statistics.
+        """
+        pass
+
+    def run(
+        self,
+        indicators: list[str] | None = None,
+        countries: list[str] | None = None,
+    ) -> IngestionResult:
+        """
+        Execute the collection with database transaction management.
+
+        The ingestion log is opened and closed in two short transactions of
+        its own, so no transaction stays open while `collect()` fetches and
+        writes data; collectors commit after each batch of observations. A
+        failed collection is still recorded in the log.
+
+        Args:
+            indicators: Optional list of indicator codes.
+            countries: Optional list of country codes.
+
+        Returns:
+            IngestionResult with operation status.
+        """
+        result = IngestionResult(
+            source=self.source_code.value,
+            started_at=utcnow(),
+        )
+
+        try:
+            with session_scope() as session:
+                source = self.get_or_create_source(session)
+                log_id = self.create_ingestion_log(session, source).id
+        except Exception as e:
+            result.status = "failed"
+            result.errors.append(str(e))
+            result.completed_at = utcnow()
+            return result
+
+        try:
+            result = self.collect(indicators, countries)
+        except Exception as e:
+            result.status = "failed"
+            result.errors.append(str(e))
+            result.completed_at = utcnow()
+
+        try:
+            with session_scope() as session:
+                log = session.get(IngestionLog, log_id)
+                self.update_ingestion_log(session, log, result)
+        except Exception as e:
+            result.status = "failed"
+            result.errors.append(str(e))
+            result.completed_at = utcnow()
+
+        return result
@@ -0,0 +1,241 @@
+"""
+Shared HTTP client setup for the collectors.
+
+`make_client` builds the pooled httpx client every collector uses.
+Throttled and temporarily failing requests are retried with backoff. GET
+responses carrying an ETag or Last-Modified header are stored under the cache
+directory. Repeat requests send If-None-Match / If-Modified-Since, and a
+304 Not Modified is answered from disk, so unchanged datasets are not
+downloaded again. Data that cannot change, such as past years or a
+pinned dataset version, can be given a max age and is then served from
+disk without any request.
+"""
+
+import hashlib
+import json
+import os
+import random
+import tempfile
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import httpx
+
+from open_data import __version__
+from open_data.config import settings
+
+# Keep-alive connections per client; enough for every concurrent request a
+# collector makes (see base.MAX_CONCURRENT_REQUESTS)
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=16)
+
+# Statuses worth retrying: throttling and transient gateway/server errors
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Longest wait between retries, in seconds, whatever Retry-After says
+MAX_RETRY_WAIT = 30.0
+
+# Headers that describe the encoded body on the wire, not the cached copy
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds to wait according to a Retry-After header, if present."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryTransport(httpx.BaseTransport):
+    """
+    httpx transport that retries throttled and transiently failed requests.
+
+    Responses with a status in RETRY_STATUSES are retried up to
+    `max_retries` times, waiting as long as the server's Retry-After asks
+    or else with jittered exponential backoff (1 s, 2 s, 4 s, ...), capped at
+    MAX_RETRY_WAIT. The last response is returned as is, so callers still
+    see the failure once retries run out.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, max_retries: int):
+        """
+        Initialize the transport.
+
+        Args:
+            transport: Transport that performs the requests.
+            max_retries: Retries after the first attempt.
+        """
+        self.transport = transport
+        self.max_retries = max_retries
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(self.max_retries + 1):
+            response = self.transport.handle_request(request)
+            if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                return response
+            wait = _retry_after(response)
+            if wait is None:
+                wait = 2 ** attempt + random.uniform(0, 1)
+            response.close()
+            time.sleep(min(wait, MAX_RETRY_WAIT))
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class CachingTransport(httpx.BaseTransport):
+    """
+    httpx transport that caches GET responses on disk.
+
+    Wraps another transport, so the client's timeouts and connection pool
+    are unchanged. Requests other than GET pass straight through.
+
+    With a `max_age`, responses are also kept when they carry no
+    validators, and a cached copy younger than `max_age` seconds is served
+    without contacting the server at all. A request can set its own limit
+    through the "cache_max_age" request extension, e.g.
+    ``client.get(url, extensions={"cache_max_age": 86400})``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        transport: httpx.BaseTransport | None = None,
+        max_age: float | None = None,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            cache_dir: Directory for cached bodies; created on first write.
+            transport: Transport that performs the requests.
+            max_age: Seconds a cached response is used without revalidating,
+                or None to always revalidate.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.transport = transport or httpx.HTTPTransport()
+        self.max_age = max_age
+
+    def _paths(self, request: httpx.Request) -> tuple[Path, Path]:
+        """Metadata and body paths for a request."""
+        key = hashlib.sha1(str(request.url).encode()).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """Write a file atomically, so concurrent readers never see it half done."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return self.transport.handle_request(request)
+
+        meta_path, body_path = self._paths(request)
+        meta = None
+        if meta_path.exists() and body_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text())
+            except ValueError:
+                meta = None
+
+        max_age = request.extensions.get("cache_max_age", self.max_age)
+        if meta and max_age is not None and time.time() - meta.get("stored_at", 0) < max_age:
+            return httpx.Response(
+                200,
+                headers=meta["headers"],
+                content=body_path.read_bytes(),
+                request=request,
+            )
+
+        if meta:
+            if meta.get("etag"):
+                request.headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request.headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self.transport.handle_request(request)
+
+        if response.status_code == 304 and meta:
+            response.close()
+            return httpx.Response(
+                200,
+                headers=meta["headers"],
+                content=body_path.read_bytes(),
+                request=request,
+            )
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified or max_age is not None):
+            return response
+
+        # Reading decodes any gzip/deflate body
+        body = response.read()
+        response.close()
+        headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        self._write(body_path, body)
+        self._write(
+            meta_path,
+            json.dumps({
+                "url": str(request.url),
+                "etag": etag,
+                "last_modified": last_modified,
+                "stored_at": time.time(),
+                "headers": headers,
+            }).encode(),
+        )
+        return httpx.Response(200, headers=headers, content=body, request=request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+def make_client(
+    timeout: float,
+    cache: str | None = None,
+    max_age: float | None = None,
+) -> httpx.Client:
+    """
+    Build a pooled HTTP client for a collector.
+
+    Connections are kept alive across requests, responses are requested
+    gzip-compressed (httpx's default Accept-Encoding), and throttled or
+    transiently failed requests are retried up to MAX_RETRIES times.
+
+    Args:
+        timeout: Read/write timeout in seconds; connecting times out after 10.
+        cache: Subdirectory of HTTP_CACHE_DIR for caching GET responses,
+            or None to disable caching.
+        max_age: Seconds cached responses are served without revalidating;
+            see CachingTransport.
+
+    Returns:
+        httpx.Client; close it with the collector.
+    """
+    transport: httpx.BaseTransport = RetryTransport(
+        httpx.HTTPTransport(limits=HTTP_LIMITS),
+        max_retries=settings.max_retries,
+    )
+    if cache and settings.http_cache_dir:
+        transport = CachingTransport(Path(settings.http_cache_dir) / cache, transport, max_age)
+    return httpx.Client(
+        timeout=httpx.Timeout(timeout, connect=10),
+        transport=transport,
+        headers={"User-Agent": f"open-data-platform/{__version__}"},
+    )
@@ -0,0 +1,460 @@
+"""
+IMF Data API client.
+
+Uses the IMF's JSON RESTful API (SDMX format).
+Documentation: https://datahelp.imf.org/knowledgebase/articles/667681
+
+Key Databases:
+- IFS: International Financial Statistics
+- BOP: Balance of Payments
+- DOT: Direction of Trade Statistics
+- GFS: Government Finance Statistics
+"""
+
+from collections.abc import Iterator
+from types import MappingProxyType
+from typing import Any
+
+import httpx
+import numpy as np
+import pandas as pd
+
+from open_data.config import DataSource, settings
+from open_data.db.connection import session_scope
+from open_data.db.models import utcnow
+from open_data.ingestion.base import FETCH_DTYPES, BaseCollector, IngestionResult
+from open_data.ingestion.http_client import make_client
+
+
+# IMF country code mapping (IMF uses different codes than ISO3)
+# Map from ISO3 to IMF country codes
+ISO3_TO_IMF = MappingProxyType({
+    # AMERICA
+    "ARG": "AR", "BRA": "BR", "CHL": "CL", "COL": "CO", "MEX": "MX",
+    "USA": "US", "CAN": "CA",
+    # EUROPE
+    "DEU": "DE", "FRA": "FR", "ITA": "IT", "SWE": "SE", "NLD": "NL",
+    "CHE": "CH", "DNK": "DK", "FIN": "FI", "NOR": "NO", "TUR": "TR",
+    "ESP": "ES", "GBR": "GB",
+    # ASIA
+    "IND": "IN", "CHN": "CN", "JPN": "JP", "VNM": "VN", "SGP": "SG",
+    # MIDDLE EAST
+    "ISR": "IL", "IRN": "IR", "ARE": "AE", "SAU": "SA", "QAT": "QA",
+    # AFRICA
+    "NER": "NE", "ZAF": "ZA", "EGY": "EG", "COD": "CD", "MAR": "MA",
+    "DZA": "DZ", "ETH": "ET", "LBY": "LY", "TZA": "TZ", "TUN": "TN",
+    "GHA": "GH",
+    # SOUTH PACIFIC
+    "AUS": "AU", "NZL": "NZ",
+})
+
+IMF_TO_ISO3 = MappingProxyType({v: k for k, v in ISO3_TO_IMF.items()})
+
+
+# Key IMF indicators from International Financial Statistics (IFS)
+IMF_INDICATORS = MappingProxyType({
+    # Exchange Rates
+    "ENDA_XDC_USD_RATE": "Exchange Rate, End of Period (LCU per USD)",
+    "ENEA_XDC_USD_RATE": "Exchange Rate, Period Average (LCU per USD)",
+    # Interest Rates
+    "FPOLM_PA": "Monetary Policy Rate (%)",
+    "FITB_PA": "Treasury Bill Rate (%)",
+    "FILR_PA": "Lending Rate (%)",
+    "FIDR_PA": "Deposit Rate (%)",
+    # Money and Banking
+    "FM_A": "Broad Money (National Currency)",
+    "FMB_XDC": "Monetary Base (National Currency)",
+    # Prices
+    "PCPI_IX": "Consumer Price Index (2010=100)",
+    "PCPI_PC_CP_A_PT": "Inflation Rate (%)",
+    "PPPI_IX": "Producer Price Index (2010=100)",
+    # Balance of Payments
+    "BCA_BP6_USD": "Current Account Balance (USD)",
+    "BGS_BP6_USD": "Goods and Services Balance (USD)",
+    "BXG_BP6_USD": "Exports of Goods (USD)",
+    "BMG_BP6_USD": "Imports of Goods (USD)",
+    # International Reserves
+    "RAFA_USD": "Total Reserves (USD)",
+    "RAFAGOLD_USD": "Gold Reserves (USD)",
+    # GDP (from IFS)
+    "NGDP_XDC": "GDP, Current Prices (National Currency)",
+    "NGDP_R_XDC": "GDP, Constant Prices (National Currency)",
+    "NGDP_D_IX": "GDP Deflator (Index)",
+})
+
+# Indicators requested together in one SDMX key ("A+B+C"), bounded by the
+# URL length the API accepts
+INDICATORS_PER_REQUEST = 10
+
+# IMF database codes
+IMF_DATABASES = MappingProxyType({
+    "IFS": "International Financial Statistics",
+    "BOP": "Balance of Payments",
+    "DOT": "Direction of Trade Statistics",
+    "GFS": "Government Finance Statistics",
+    "CDIS": "Coordinated Direct Investment Survey",
+    "CPIS": "Coordinated Portfolio Investment Survey",
+})
+
+
+class IMFCollector(BaseCollector):
+    """Collector for IMF International Financial Statistics."""
+
+    source_code = DataSource.IMF
+    source_name = "International Monetary Fund"
+    base_url = "http://dataservices.imf.org/REST/SDMX_JSON.svc/"
+    indicator_categories = ("FINANCIAL",)
+
+    def __init__(
+        self,
+        countries: list[str] | None = None,
+        start_year: int = 1960,
+        end_year: int | None = None,
+        indicators: list[str] | None = None,
+        database: str = "IFS",
+    ):
+        """
+        Initialize IMF collector.
+
+        Args:
+            countries: List of ISO3 country codes.
+            start_year: First year to collect.
+            end_year: Last year to collect.
+            indicators: List of IMF indicator codes.
+            database: IMF database code (IFS, BOP, etc.)
+        """
+        super().__init__(countries, start_year, end_year)
+        self.indicator_codes = indicators or list(IMF_INDICATORS.keys())
+        self.database = database
+        self._imf_countries = self._to_imf_codes(self.countries)
+        self.client = make_client(settings.request_timeout, cache="imf")
+
+    @staticmethod
+    def _to_imf_codes(countries: list[str]) -> tuple[str, ...]:
+        """Convert ISO3 codes to IMF country codes, skipping unmapped ones."""
+        return tuple(ISO3_TO_IMF[c] for c in countries if c in ISO3_TO_IMF)
+
+    def _get_imf_countries(self) -> list[str]:
+        """Convert ISO3 codes to IMF country codes."""
+        return list(self._imf_countries)
+
+    def fetch_indicators(self) -> list[dict[str, Any]]:
+        """
+        Fetch available indicators from IMF.
+
+        Returns:
+            List of indicator definitions.
+        """
+        indicators = []
+        for code, name in IMF_INDICATORS.items():
+            indicators.append({
+                "code": code,
+                "name": name,
+                "description": "",
+                "unit": "",
+                "source": "IMF",
+                "database": self.database,
+            })
+        return indicators
+
+    def _fetch_dataflow_structure(self) -> dict:
+        """Fetch the structure of the IFS dataflow."""
+        url = f"{self.base_url}DataStructure/{self.database}"
+        try:
+            response = self.client.get(url)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            print(f"Error fetching dataflow structure: {e}")
+            return {}
+
+    def fetch_data(
+        self,
+        indicators: list[str],
+        countries: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Fetch data from IMF API.
+
+        The IMF API uses a key-based URL structure:
+        /CompactData/{database}/{frequency}.{country}.{indicator}
+
+        Indicators are requested INDICATORS_PER_REQUEST at a time using
+        the SDMX "+" syntax, with the requests sent concurrently.
+
+        Args:
+            indicators: List of IMF indicator codes.
+            countries: List of country codes (ISO3 or IMF format).
+
+        Returns:
+            DataFrame with columns: country, indicator, year, value
+        """
+        imf_countries = self._to_imf_codes(countries) if countries else self._imf_countries
+
+        if not imf_countries:
+            return pd.DataFrame(columns=["country", "indicator", "year", "value"])
+
+        all_data = list(self._fetch_frames(indicators, imf_countries))
+
+        if not all_data:
+            return pd.DataFrame(columns=["country", "indicator", "year", "value"])
+
+        return pd.concat(all_data, ignore_index=True).astype(FETCH_DTYPES)
+
+    def _fetch_frames(
+        self,
+        indicators: list[str],
+        imf_countries: tuple[str, ...],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Fetch indicators and yield one DataFrame per request as it completes.
+
+        Args:
+            indicators: List of IMF indicator codes.
+            imf_countries: IMF country codes.
+
+        Yields:
+            Non-empty DataFrames limited to the configured year range.
+        """
+        if not indicators or not imf_countries:
+            return
+
+        # Build the dimension key: Frequency.Country.Indicator
+        # A = Annual, Q = Quarterly, M = Monthly
+        frequency = "A"  # Annual data
+
+        # IMF API URL format; only the indicator part varies per request
+        url_prefix = f"{self.base_url}CompactData/{self.database}/{frequency}.{'+'.join(imf_countries)}."
+        indicator_keys = [
+            "+".join(indicators[i:i + INDICATORS_PER_REQUEST])
+            for i in range(0, len(indicators), INDICATORS_PER_REQUEST)
+        ]
+        frames = self._iter_concurrently(
+            lambda indicator: self._fetch_indicator(indicator, url_prefix),
+            indicator_keys,
+        )
+        for df in frames:
+            if not df.empty:
+                yield df
+
+    def _fetch_indicator(self, indicator: str, url_prefix: str) -> pd.DataFrame:
+        """
+        Fetch indicators for a set of IMF country codes in one request.
+
+        Args:
+            indicator: IMF indicator code, or several joined with "+".
+            url_prefix: CompactData URL up to and including the country
+                dimension and its trailing ".".
+
+        Returns:
+            DataFrame with columns: country, indicator, year, value;
+            empty on error.
+        """
+        url = url_prefix + indicator
+
+        try:
+            response = self.client.get(url)
+
+            if response.status_code == 404:
+                print(f"Indicator {indicator} not found")
+                return pd.DataFrame()
+
+            response.raise_for_status()
+            data = response.json()
+
+            # Parse the SDMX-JSON response
+            return self._parse_imf_response(data, indicator)
+
+        except httpx.HTTPStatusError as e:
+            print(f"HTTP error for {indicator}: {e}")
+        except Exception as e:
+            print(f"Error fetching {indicator}: {e}")
+        return pd.DataFrame()
+
+    def _parse_imf_response(self, data: dict, indicator: str) -> pd.DataFrame:
+        """
+        Parse IMF SDMX-JSON response.
+
+        Args:
+            data: JSON response from IMF API.
+            indicator: Requested indicator code, used for series that do
+                not carry an @INDICATOR attribute.
+
+        Returns:
+            DataFrame with columns: country, indicator, year, value.
+            Observations without a parseable period or value, or outside
+            the configured years, are dropped.
+        """
+        try:
+            # Navigate the SDMX structure
+            dataset = data.get("CompactData", {}).get("DataSet", {})
+            series = dataset.get("Series", [])
+
+            # Handle single series (not a list)
+            if isinstance(series, dict):
+                series = [series]
+
+            # Gather the raw strings column by column; the conversions below
+            # then run once over all observations
+            areas: list[str] = []
+            indicator_codes: list[str] = []
+            periods: list[Any] = []
+            values: list[Any] = []
+            for s in series:
+                obs = s.get("Obs", [])
+                # A series with a single observation has a dict, not a list
+                if isinstance(obs, dict):
+                    obs = [obs]
+                areas.extend([s.get("@REF_AREA", "")] * len(obs))
+                indicator_codes.extend([s.get("@INDICATOR", indicator)] * len(obs))
+                periods.extend([o.get("@TIME_PERIOD") for o in obs])
+                values.extend([o.get("@OBS_VALUE") for o in obs])
+
+            if not areas:
+                return pd.DataFrame()
+
+            year = pd.to_numeric(pd.Series(periods, dtype="string").str[:4], errors="coerce")
+            year = year.to_numpy(dtype="float64", na_value=np.nan)
+            value = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+            value = value.to_numpy(dtype="float64", na_value=np.nan)
+
+            # Keep parseable values within the year range; NaN years compare
+            # False, so unparseable periods drop out too
+            keep = (year >= self.start_year) & (year <= self.end_year) & ~np.isnan(value)
+            if not keep.any():
+                return pd.DataFrame()
+
+            country_imf = pd.Series(areas, dtype="string")[keep]
+            return pd.DataFrame({
+                "country": country_imf.map(IMF_TO_ISO3).fillna(country_imf).to_numpy(),
+                "indicator": np.asarray(indicator_codes, dtype=object)[keep],
+                "year": year[keep].astype("int64"),
+                "value": value[keep],
+            })
+
+        except Exception as e:
+            print(f"Error parsing IMF response: {e}")
+            return pd.DataFrame()
+
+    def _collect_records(
+        self,
+        indicator_codes: list[str],
+        countries: list[str] | None,
+        country_map: dict[str, int],
+        indicator_map: dict[str, int],
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Fetch indicators and yield observation rows as each request completes.
+
+        Requests keep running on worker threads while the caller writes
+        the rows of earlier ones, so network and database time overlap.
+
+        Args:
+            indicator_codes: Indicator codes to fetch.
+            countries: List of country codes, or None for the configured ones.
+            country_map: ISO3 code to country ID.
+            indicator_map: Indicator code to indicator ID.
+
+        Yields:
+            Observation dicts for `upsert_observations`.
+        """
+        imf_countries = self._to_imf_codes(countries) if countries else self._imf_countries
+        if not imf_countries:
+            return
+        for df in self._fetch_frames(indicator_codes, imf_countries):
+            yield from self._observation_records(df, country_map, indicator_map)
+
+    def collect(
+        self,
+        indicators: list[str] | None = None,
+        countries: list[str] | None = None,
+    ) -> IngestionResult:
+        """
+        Run the full IMF data collection.
+
+        Args:
+            indicators: List of indicator codes to fetch.
+            countries: List of country codes.
+
+        Returns:
+            IngestionResult with collection statistics.
+        """
+        result = IngestionResult(
+            source=self.source_code.value,
+            started_at=utcnow(),
+        )
+
+        indicator_codes = indicators or self.indicator_codes
+        target_countries = countries or self.countries
+
+        try:
+            with session_scope() as session:
+                source = self.get_or_create_source(session)
+
+                country_map = self._get_country_map(session)
+
+                # Create/update indicator records
+                indicator_map = self._get_indicator_map(
+                    session,
+                    source,
+                    {code: IMF_INDICATORS.get(code, code) for code in indicator_codes},
+                )
+
+                # Fetch data in batches
+                print(f"Fetching {len(indicator_codes)} indicators for {len(target_countries)} countries...")
+
+                records = self._collect_records(indicator_codes, countries, country_map, indicator_map)
+                result.records_processed += self.upsert_observations(session, records, commit=True)
+                print(f"Total records saved: {result.records_processed}")
+
+                source.last_updated = utcnow()
+                result.status = "completed"
+                result.completed_at = utcnow()
+
+        except Exception as e:
+            result.status = "failed"
+            result.errors.append(str(e))
+            result.completed_at = utcnow()
+
+        return result
+
+
+def fetch_imf_indicator(
+    indicator: str,
+    countries: list[str] | None = None,
+    start_year: int = 1960,
+    end_year: int | None = None,
+) -> pd.DataFrame:
+    """
+    Convenience function to fetch a single IMF indicator.
+
+    Args:
+        indicator: IMF indicator code.
+        countries: List of ISO3 codes.
+        start_year: First year.
+        end_year: Last year.
+
+    Returns:
+        DataFrame with the data.
+    """
+    with IMFCollector(
+        countries=countries,
+        start_year=start_year,
+        end_year=end_year,
+        indicators=[indicator],
+    ) as collector:
+        return collector.fetch_data([indicator], countries)
+
+
+def list_imf_databases() -> pd.DataFrame:
+    """List available IMF databases."""
+    return pd.DataFrame([
+        {"code": k, "name": v} for k, v in IMF_DATABASES.items()
+    ])
+
+
+def list_imf_indicators() -> pd.DataFrame:
+    """List available IMF indicators (from our curated list)."""
+    return pd.DataFrame([
+        {"code": k, "name": v} for k, v in IMF_INDICATORS.items()
+    ])
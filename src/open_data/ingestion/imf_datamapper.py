@@ -0,0 +1,115 @@
+"""
+IMF DataMapper API client.
+"""
+
+from types import MappingProxyType
+
+import pandas as pd
+
+from open_data.config import COUNTRIES, DataSource
+from open_data.db.connection import session_scope
+from open_data.db.models import utcnow
+from open_data.ingestion.base import FETCH_DTYPES, BaseCollector, IngestionResult
+from open_data.ingestion.http_client import make_client
+
+
+IMF_DATAMAPPER_BASE = "https://www.imf.org/external/datamapper/api/v1"
+
+IMF_DATAMAPPER_INDICATORS = MappingProxyType({
+    "NGDP_RPCH": "Real GDP growth (annual %)",
+    "NGDPD": "GDP, current prices (billions USD)",
+    "NGDPDPC": "GDP per capita, current prices (USD)",
+    "PPPGDP": "GDP, PPP (billions international $)",
+    "PPPPC": "GDP per capita, PPP (international $)",
+    "PCPIPCH": "Inflation rate, average consumer prices (%)",
+    "PCPIEPCH": "Inflation rate, end of period (%)",
+    "LP": "Population (millions)",
+    "LUR": "Unemployment rate (%)",
+    "BCA": "Current account balance (billions USD)",
+    "BCA_NGDPD": "Current account balance (% of GDP)",
+    "GGXWDG_NGDP": "General government gross debt (% of GDP)",
+})
+
+
+class IMFDataMapperCollector(BaseCollector):
+    source_code = DataSource.IMF
+    source_name = "International Monetary Fund"
+    base_url = IMF_DATAMAPPER_BASE
+    indicator_categories = ("FINANCIAL", "ECONOMIC")
+
+    def __init__(self, countries=None, start_year=1980, end_year=None, indicators=None):
+        super().__init__(countries, start_year, end_year)
+        self.indicator_codes = indicators or list(IMF_DATAMAPPER_INDICATORS.keys())
+        self._allowed = frozenset(COUNTRIES) & frozenset(self.countries)
+        self.client = make_client(60, cache="imf_datamapper")
+
+    def fetch_indicators(self):
+        return [{"code": c, "name": n} for c, n in IMF_DATAMAPPER_INDICATORS.items()]
+
+    def _fetch_indicator_data(self, indicator):
+        url = f"{IMF_DATAMAPPER_BASE}/{indicator}"
+        try:
+            response = self.client.get(url)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            print(f"    Error fetching {indicator}: {e}")
+            return []
+
+        values = data.get("values", {}).get(indicator, {})
+        if not values:
+            return []
+
+        records = []
+        for country_code, yearly_data in values.items():
+            if country_code not in self._allowed:
+                continue
+            for year_str, value in yearly_data.items():
+                try:
+                    year = int(year_str)
+                    if self.start_year <= year <= self.end_year and value is not None:
+                        records.append({"country": country_code, "indicator": indicator, "year": year, "value": float(value)})
+                except (ValueError, TypeError):
+                    continue
+        return records
+
+    def fetch_data(self, indicators, countries=None):
+        print(f"  Fetching {len(indicators)} indicators...")
+        # One flat record list, turned into a DataFrame once
+        records = [r for rs in self._fetch_concurrently(self._fetch_indicator_data, indicators) for r in rs]
+        return pd.DataFrame.from_records(records, columns=["country", "indicator", "year", "value"]).astype(FETCH_DTYPES)
+
+    def collect(self, indicators=None, countries=None):
+        result = IngestionResult(source=self.source_code.value, started_at=utcnow())
+        indicator_codes = indicators or self.indicator_codes
+
+        try:
+            with session_scope() as session:
+                source = self.get_or_create_source(session)
+                country_map = self._get_country_map(session)
+
+                indicator_map = self._get_indicator_map(session, source, {code: IMF_DATAMAPPER_INDICATORS.get(code, code) for code in indicator_codes})
+
+                print("Fetching IMF DataMapper data...")
+                df = self.fetch_data(indicator_codes)
+
+                if df.empty:
+                    result.status = "completed"
+                    result.completed_at = utcnow()
+                    return result
+
+                print(f"Total records fetched: {len(df)}")
+
+                records = self._observation_records(df, country_map, indicator_map)
+                result.records_processed += self.upsert_observations(session, records, commit=True)
+
+                source.last_updated = utcnow()
+                result.status = "completed"
+                result.completed_at = utcnow()
+
+        except Exception as e:
+            result.status = "failed"
+            result.errors.append(str(e))
+            result.completed_at = utcnow()
+
+        return result
@@ -0,0 +1,94 @@
+import traceback
+from types import MappingProxyType
+
+import pandas as pd
+
+from open_data.config import COUNTRIES, DataSource
+from open_data.db.connection import session_scope
+from open_data.db.models import utcnow
+from open_data.ingestion.base import FETCH_DTYPES, BaseCollector, IngestionResult
+from open_data.ingestion.http_client import make_client
+
+IRENA_API_BASE = "https://pxweb.irena.org/api/v1/en/IRENASTAT"
+IRENA_INDICATORS = MappingProxyType({
+    "IRENA.CAP.RENEW": "Renewable electricity capacity (MW)",
+    "IRENA.CAP.SOLAR": "Solar PV capacity (MW)",
+    "IRENA.CAP.WIND": "Wind capacity (MW)",
+    "IRENA.CAP.HYDRO": "Hydropower capacity (MW)",
+    "IRENA.GEN.RENEW": "Renewable electricity generation (GWh)",
+    "IRENA.GEN.SOLAR": "Solar PV generation (GWh)",
+    "IRENA.GEN.WIND": "Wind generation (GWh)",
+    "IRENA.GEN.HYDRO": "Hydropower generation (GWh)",
+})
+TECH_MAP = MappingProxyType({"0": "RENEW", "1": "SOLAR", "3": "WIND", "5": "HYDRO"})
+
+class IRENACollector(BaseCollector):
+    source_code = DataSource.IRENA
+    source_name = "International Renewable Energy Agency"
+    base_url = IRENA_API_BASE
+    indicator_categories = ("ENERGY", "ENVIRONMENT")
+    def __init__(self, countries=None, start_year=2000, end_year=None, indicators=None):
+        super().__init__(countries, start_year, end_year)
+        self.indicator_codes = indicators or list(IRENA_INDICATORS.keys())
+        self.client = make_client(120)
+    def fetch_indicators(self):
+        return [{"code": c, "name": n} for c, n in IRENA_INDICATORS.items()]
+    def fetch_data(self, indicators, countries=None):
+        target_countries = countries or list(COUNTRIES.keys())
+        year_indices = [str(y - 2000) for y in range(self.start_year, self.end_year + 1)]
+        results = self._fetch_concurrently(lambda dt: self._fetch_data_type(*dt, target_countries, year_indices), [("0", "CAP"), ("1", "GEN")])
+        frames = [df for df in results if not df.empty]
+        return pd.concat(frames, ignore_index=True).astype(FETCH_DTYPES) if frames else pd.DataFrame(columns=["country", "year", "indicator", "value"])
+    def _fetch_data_type(self, data_type, type_name, target_countries, year_indices):
+        url = f"{IRENA_API_BASE}/Power Capacity and Generation/Country_ELECSTAT_2025_H2_PX.px"
+        print(f"  Fetching {type_name} data...")
+        query = {"query": [
+            {"code": "Country/area", "selection": {"filter": "item", "values": target_countries}},
+            {"code": "Technology", "selection": {"filter": "item", "values": list(TECH_MAP.keys())}},
+            {"code": "Data Type", "selection": {"filter": "item", "values": [data_type]}},
+            {"code": "Grid connection", "selection": {"filter": "item", "values": ["0"]}},
+            {"code": "Year", "selection": {"filter": "item", "values": year_indices}}
+        ], "response": {"format": "json"}}
+        try:
+            r = self.client.post(url, json=query, timeout=120)
+            if r.status_code != 200:
+                print(f"    Error: {r.status_code}")
+                return pd.DataFrame()
+            data = r.json().get("data", [])
+            print(f"    Got {len(data)} records")
+            if not data:
+                return pd.DataFrame()
+            # Key is (country, technology, data type, grid connection, year index)
+            keys = pd.DataFrame([item["key"] for item in data], columns=["country", "tech", "type", "grid", "year_idx"])
+            values = pd.Series([item["values"][0] for item in data])
+            mask = (keys["tech"].isin(TECH_MAP) & values.notna() & ~values.isin(["-", "", "0"])).to_numpy()
+            keys = keys[mask]
+            df = pd.DataFrame({
+                "country": keys["country"].to_numpy(),
+                "year": 2000 + pd.to_numeric(keys["year_idx"], errors="coerce").to_numpy(),
+                "indicator": keys["tech"].map({t: f"IRENA.{type_name}.{name}" for t, name in TECH_MAP.items()}).to_numpy(),
+                "value": pd.to_numeric(values[mask], errors="coerce").to_numpy(),
+            }).dropna(subset=["year", "value"])
+            return df.astype({"year": "int64"})
+        except Exception as e:
+            print(f"    Error: {e}")
+            return pd.DataFrame()
+    def collect(self, indicators=None, countries=None):
+        result = IngestionResult(source=self.source_code.value, started_at=utcnow())
+        try:
+            with session_scope() as session:
+                source = self.get_or_create_source(session)
+                country_map = self._get_country_map(session)
+                indicator_map = self._get_indicator_map(session, source, IRENA_INDICATORS)
+                print("Fetching IRENA renewable energy data...")
+                df = self.fetch_data(list(IRENA_INDICATORS.keys()), countries or list(COUNTRIES.keys()))
+                if df.empty: result.status = "completed"; result.completed_at = utcnow(); return result
+                print(f"Total fetched: {len(df)}")
+                records = self._observation_records(df, country_map, indicator_map)
+                saved = self.upsert_observations(session, records, commit=True)
+                result.records_processed = saved
+                print(f"Saved: {saved}")
+                source.last_updated = utcnow()
+                result.status = "completed"; result.completed_at = utcnow()
+        except Exception as e: result.status = "failed"; result.errors.append(str(e)); result.completed_at = utcnow(); traceback.print_exc()
+        return result
@@ -0,0 +1,438 @@
+"""
+Uppsala Conflict Data Program (UCDP) API client.
+
+UCDP is the world's main provider of data on organized violence.
+API Documentation: https://ucdp.uu.se/apidocs/
+"""
+
+from collections.abc import Iterator
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+import orjson
+import pandas as pd
+
+from open_data.config import (
+    COUNTRIES,
+    UCDP_API_BASE,
+    UCDP_API_VERSION,
+    UCDP_INDICATORS,
+    DataSource,
+)
+from open_data.db.connection import session_scope
+from open_data.db.models import utcnow
+from open_data.ingestion.base import FETCH_DTYPES, BaseCollector, IngestionResult
+from open_data.ingestion.http_client import make_client
+
+
+# Mapping from UCDP location IDs to ISO3 codes
+# UCDP uses Gleditsch-Ward country codes, we need to map to ISO3
+UCDP_TO_ISO3 = {
+    "United States of America": "USA",
+    "United Kingdom": "GBR",
+    "Germany": "DEU",
+    "France": "FRA",
+    "Italy": "ITA",
+    "Spain": "ESP",
+    "Turkey": "TUR",
+    "Russia": "RUS",
+    "China": "CHN",
+    "India": "IND",
+    "Japan": "JPN",
+    "Brazil": "BRA",
+    "Mexico": "MEX",
+    "Argentina": "ARG",
+    "Colombia": "COL",
+    "Chile": "CHL",
+    "Canada": "CAN",
+    "Australia": "AUS",
+    "South Africa": "ZAF",
+    "Egypt": "EGY",
+    "Nigeria": "NGA",
+    "Algeria": "DZA",
+    "Morocco": "MAR",
+    "Ethiopia": "ETH",
+    "DR Congo (Zaire)": "COD",
+    "Congo, Democratic Republic of": "COD",
+    "Tanzania": "TZA",
+    "Iran": "IRN",
+    "Saudi Arabia": "SAU",
+    "Israel": "ISR",
+    "United Arab Emirates": "ARE",
+    "Qatar": "QAT",
+    "Vietnam": "VNM",
+    "Singapore": "SGP",
+    "Sweden": "SWE",
+    "Norway": "NOR",
+    "Denmark": "DNK",
+    "Finland": "FIN",
+    "Netherlands": "NLD",
+    "Switzerland": "CHE",
+    "New Zealand": "NZL",
+    "Libya": "LBY",
+    "Tunisia": "TUN",
+    "Ghana": "GHA",
+    "Niger": "NER",
+}
+
+# Rows per API page, and the last page index fetched (safety limit)
+PAGE_SIZE = 1000
+MAX_PAGES = 100
+
+# Responses come from a pinned dataset version (UCDP_API_VERSION), so
+# cached pages are reused for this many seconds without revalidating
+CACHE_MAX_AGE = 30 * 24 * 3600
+
+# Lowercased country names from our config, for matching UCDP locations
+_NAME_TO_ISO3 = {country.name.lower(): iso3 for iso3, country in COUNTRIES.items()}
+
+
+class UCDPCollector(BaseCollector):
+    """Collector for Uppsala Conflict Data Program."""
+
+    source_code = DataSource.UCDP
+    source_name = "Uppsala Conflict Data Program"
+    base_url = UCDP_API_BASE
+    indicator_categories = ("SECURITY",)
+    indicator_unit = "deaths"
+
+    def __init__(
+        self,
+        countries: list[str] | None = None,
+        start_year: int = 1989,  # UCDP data starts in 1989
+        end_year: int | None = None,
+        indicators: list[str] | None = None,
+    ):
+        """
+        Initialize UCDP collector.
+
+        Args:
+            countries: List of ISO3 country codes.
+            start_year: First year to collect (UCDP starts at 1989).
+            end_year: Last year to collect.
+            indicators: List of UCDP indicator codes.
+        """
+        # Ensure years are integers
+        start_year = int(start_year) if start_year else 1989
+        start_year = max(start_year, 1989)
+        if end_year is None:
+            end_year = datetime.now().year
+        else:
+            end_year = int(end_year)
+        super().__init__(countries, start_year, end_year)
+        self.indicator_codes = indicators or list(UCDP_INDICATORS.keys())
+        self.client = make_client(60, cache="ucdp", max_age=CACHE_MAX_AGE)
+        self.client.headers["Accept"] = "application/json"
+
+    def _get_page(self, url: str, params: dict, page: int) -> dict:
+        """Fetch and decode one page of a UCDP endpoint."""
+        response = self.client.get(url, params={**params, "page": page})
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Fetch every page of a UCDP endpoint, yielding each page's rows.
+
+        The first page reports TotalPages; the remaining pages are then
+        fetched concurrently and yielded as they arrive, so the caller
+        processes one page while the next ones are still downloading.
+        """
+        url = f"{UCDP_API_BASE}/{endpoint}/{UCDP_API_VERSION}"
+        params = {**(params or {}), "pagesize": PAGE_SIZE}
+
+        results = self._get_page(url, params, 0)
+        total_pages = results.get("TotalPages")
+        results = results.get("Result", [])
+        if not results:
+            return
+        yield results
+
+        if total_pages is None:
+            # No page count reported; walk pages until one comes back empty
+            for page in range(1, MAX_PAGES + 1):
+                results = self._get_page(url, params, page).get("Result", [])
+                if not results:
+                    return
+                yield results
+            return
+
+        yield from self._iter_concurrently(
+            lambda page: self._get_page(url, params, page).get("Result", []),
+            range(1, min(int(total_pages), MAX_PAGES + 1)),
+        )
+
+    def fetch_indicators(self) -> list[dict[str, Any]]:
+        """Fetch indicator metadata."""
+        return [
+            {
+                "code": code,
+                "name": name,
+                "description": f"UCDP {name}",
+                "unit": "deaths",
+                "source": "UCDP",
+            }
+            for code, name in UCDP_INDICATORS.items()
+        ]
+
+    def _fetch_deaths(
+        self,
+        endpoint: str,
+        label: str,
+        columns: dict[str, str],
+    ) -> pd.DataFrame:
+        """
+        Fetch one UCDP dataset and sum its fatalities by country and year.
+
+        Rows are filtered and aggregated column-wise; each distinct location
+        name is resolved to ISO3 only once, and rows outside our countries
+        are dropped first.
+
+        Args:
+            endpoint: API endpoint, e.g. "battledeaths".
+            label: Description used in progress messages.
+            columns: API fatality field to indicator code.
+
+        Returns:
+            DataFrame with columns country, year, indicator and value, or
+            an empty DataFrame if nothing matched.
+        """
+        print(f"  Fetching {label}...")
+        try:
+            # Keep only the fields we use from each page as it arrives
+            frames = [
+                pd.DataFrame(results, columns=["location", "year", *columns])
+                for results in self._iter_pages(endpoint)
+            ]
+        except Exception as e:
+            print(f"  Warning: Could not fetch {label}: {e}")
+            return pd.DataFrame()
+
+        if not frames:
+            return pd.DataFrame()
+
+        df = pd.concat(frames, ignore_index=True)
+        locations = df["location"].fillna("")
+        countries = set(self.countries)
+        wanted = {}
+        for location in locations.unique():
+            iso3 = self._location_to_iso3(location)
+            if iso3 in countries:
+                wanted[location] = iso3
+
+        # Drop other locations before converting anything row by row
+        in_countries = locations.isin(wanted.keys())
+        df = df[in_countries].assign(country=locations[in_countries].map(wanted))
+        df["year"] = pd.to_numeric(df["year"], errors="coerce")
+        df = df[df["year"].between(self.start_year, self.end_year)]
+        if df.empty:
+            return pd.DataFrame()
+
+        # Death counts fit int32 and years int16; narrow columns and a
+        # categorical country key make the groupby cheaper
+        values = df[list(columns)].apply(pd.to_numeric, errors="coerce").fillna(0)
+        df = pd.concat(
+            [
+                df["country"].astype("category"),
+                df["year"].astype("int16"),
+                values.astype("int32").rename(columns=columns),
+            ],
+            axis=1,
+        )
+        # Aggregate by country-year (sum all conflicts), then go long
+        df = df.groupby(["country", "year"], sort=False, observed=True, as_index=False)[
+            list(columns.values())
+        ].sum()
+        return df.melt(id_vars=["country", "year"], var_name="indicator", value_name="value")
+
+    def _fetch_battle_deaths(self) -> pd.DataFrame:
+        """Fetch battle-related deaths from state-based conflicts."""
+        return self._fetch_deaths(
+            "battledeaths",
+            "battle-related deaths",
+            {"bd_best": "UCDP.BD.TOTAL", "bd_low": "UCDP.BD.LOW", "bd_high": "UCDP.BD.HIGH"},
+        )
+
+    def _fetch_nonstate_deaths(self) -> pd.DataFrame:
+        """Fetch deaths from non-state conflicts."""
+        return self._fetch_deaths(
+            "nonstate",
+            "non-state conflict deaths",
+            {
+                "best_fatality_estimate": "UCDP.NS.TOTAL",
+                "low_fatality_estimate": "UCDP.NS.LOW",
+                "high_fatality_estimate": "UCDP.NS.HIGH",
+            },
+        )
+
+    def _fetch_onesided_deaths(self) -> pd.DataFrame:
+        """Fetch deaths from one-sided violence (attacks on civilians)."""
+        return self._fetch_deaths(
+            "onesided",
+            "one-sided violence deaths",
+            {
+                "best_fatality_estimate": "UCDP.OS.TOTAL",
+                "low_fatality_estimate": "UCDP.OS.LOW",
+                "high_fatality_estimate": "UCDP.OS.HIGH",
+            },
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _location_to_iso3(location: str) -> str | None:
+        """Convert UCDP location name to ISO3 code."""
+        # Direct mapping
+        if location in UCDP_TO_ISO3:
+            return UCDP_TO_ISO3[location]
+
+        # Try to match by country name in our config
+        location = location.lower()
+        if location in _NAME_TO_ISO3:
+            return _NAME_TO_ISO3[location]
+        for name, iso3 in _NAME_TO_ISO3.items():
+            if location in name:
+                return iso3
+
+        return None
+
+    def fetch_data(
+        self,
+        indicators: list[str],
+        countries: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Fetch conflict data for specified indicators and countries.
+
+        Args:
+            indicators: List of UCDP indicator codes.
+            countries: List of ISO3 country codes.
+
+        Returns:
+            DataFrame with columns: country, indicator, year, value
+        """
+        target_countries = countries or self.countries
+
+        all_data = []
+
+        # Fetch data based on requested indicators
+        bd_indicators = [i for i in indicators if i.startswith("UCDP.BD")]
+        ns_indicators = [i for i in indicators if i.startswith("UCDP.NS")]
+        os_indicators = [i for i in indicators if i.startswith("UCDP.OS")]
+
+        if bd_indicators:
+            df = self._fetch_battle_deaths()
+            if not df.empty:
+                all_data.append(df)
+
+        if ns_indicators:
+            df = self._fetch_nonstate_deaths()
+            if not df.empty:
+                all_data.append(df)
+
+        if os_indicators:
+            df = self._fetch_onesided_deaths()
+            if not df.empty:
+                all_data.append(df)
+
+        if not all_data:
+            return pd.DataFrame(columns=["country", "indicator", "year", "value"])
+
+        result = pd.concat(all_data, ignore_index=True)
+
+        # Keep requested indicators and target countries with positive values
+        mask = (
+            result["indicator"].isin(indicators)
+            & result["country"].isin(target_countries)
+            & (result["value"] > 0)
+        )
+        return result[mask].astype(FETCH_DTYPES)
+
+    def collect(
+        self,
+        indicators: list[str] | None = None,
+        countries: list[str] | None = None,
+    ) -> IngestionResult:
+        """Run the full UCDP data collection."""
+        result = IngestionResult(
+            source=self.source_code.value,
+            started_at=utcnow(),
+        )
+
+        indicator_codes = indicators or self.indicator_codes
+        target_countries = countries or self.countries
+
+        try:
+            with session_scope() as session:
+                # Get source
+                source = self.get_or_create_source(session)
+
+                # Get country ID mapping
+                country_map = self._get_country_map(session)
+
+                # Resolve indicator IDs, creating missing indicators
+                indicator_map = self._get_indicator_map(
+                    session,
+                    source,
+                    {code: UCDP_INDICATORS.get(code, code) for code in indicator_codes},
+                )
+
+                # Fetch all data
+                print("Fetching UCDP conflict data...")
+                df = self.fetch_data(indicator_codes, target_countries)
+
+                if df.empty:
+                    print("No conflict data found for specified countries/years")
+                    result.status = "completed"
+                    result.completed_at = utcnow()
+                    return result
+
+                print(f"Total records fetched: {len(df)}")
+
+                # Map codes to IDs column-wise and upsert, committing per batch
+                records = self._observation_records(df, country_map, indicator_map)
+                result.records_processed = self.upsert_observations(session, records, commit=True)
+                print(f"Total records saved: {result.records_processed}")
+
+                # Update source timestamp
+                source.last_updated = utcnow()
+
+                result.status = "completed"
+                result.completed_at = utcnow()
+
+        except Exception as e:
+            result.status = "failed"
+            result.errors.append(str(e))
+            result.completed_at = utcnow()
+            import traceback
+            traceback.print_exc()
+
+        return result
+
+
+def fetch_conflict_summary(
+    countries: list[str] | None = None,
+    start_year: int = 1989,
+    end_year: int | None = None,
+) -> pd.DataFrame:
+    """
+    Convenience function to fetch a summary of conflict deaths.
+
+    Args:
+        countries: List of ISO3 codes.
+        start_year: First year.
+        end_year: Last year.
+
+    Returns:
+        DataFrame with conflict death summary.
+    """
+    with UCDPCollector(
+        countries=countries,
+        start_year=start_year,
+        end_year=end_year,
+    ) as collector:
+        return collector.fetch_data(list(UCDP_INDICATORS.keys()), countries)
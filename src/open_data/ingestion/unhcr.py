@@ -0,0 +1,71 @@
+from datetime import datetime
+from itertools import product
+
+import orjson
+import pandas as pd
+
+from open_data.config import COUNTRIES, DataSource
+from open_data.db.connection import session_scope
+from open_data.db.models import utcnow
+from open_data.ingestion.base import FETCH_DTYPES, BaseCollector, IngestionResult
+from open_data.ingestion.http_client import make_client
+
+UNHCR_API_BASE = "https://api.unhcr.org/population/v1"
+UNHCR_INDICATORS = {"UNHCR.REF.IN": "Refugees hosted", "UNHCR.ASY.IN": "Asylum seekers hosted", "UNHCR.IDP": "Internally displaced", "UNHCR.STA": "Stateless persons", "UNHCR.REF.OUT": "Refugees from country", "UNHCR.ASY.OUT": "Asylum seekers from country"}
+# Population item fields to indicator codes, for asylum (coa) and origin (coo) queries
+HOSTED_COLUMNS = {"refugees": "UNHCR.REF.IN", "asylum_seekers": "UNHCR.ASY.IN", "idps": "UNHCR.IDP", "stateless": "UNHCR.STA"}
+ORIGIN_COLUMNS = {"refugees": "UNHCR.REF.OUT", "asylum_seekers": "UNHCR.ASY.OUT"}
+# Figures for years before last are final; reuse cached responses this many seconds
+HISTORICAL_MAX_AGE = 30 * 24 * 3600
+
+class UNHCRCollector(BaseCollector):
+    source_code = DataSource.UNHCR
+    source_name = "UN High Commissioner for Refugees"
+    base_url = UNHCR_API_BASE
+    indicator_categories = ("HUMANITARIAN", "SOCIAL")
+    def __init__(self, countries=None, start_year=2000, end_year=None, indicators=None):
+        super().__init__(countries, start_year, end_year)
+        self.indicator_codes = indicators or list(UNHCR_INDICATORS.keys())
+        self.client = make_client(60, cache="unhcr")
+    def fetch_indicators(self):
+        return [{"code": c, "name": n} for c, n in UNHCR_INDICATORS.items()]
+    def _fetch_items(self, query, columns, max_age=None):
+        try:
+            r = self.client.get(f"{UNHCR_API_BASE}/population/?{query}", extensions={"cache_max_age": max_age})
+            if r.status_code == 200:
+                df = pd.DataFrame(orjson.loads(r.content).get("items", []), columns=list(columns))
+                return df.rename(columns=columns).melt(var_name="indicator", value_name="value")
+        except: pass
+        return None
+    def _fetch_country_data(self, iso3, year):
+        max_age = HISTORICAL_MAX_AGE if year < datetime.now().year - 1 else None
+        frames = [df for df in (self._fetch_items(f"year={year}&coa={iso3}", HOSTED_COLUMNS, max_age), self._fetch_items(f"year={year}&coo={iso3}", ORIGIN_COLUMNS, max_age)) if df is not None]
+        if not frames: return None
+        df = pd.concat(frames, ignore_index=True)
+        df["value"] = pd.to_numeric(df["value"], errors="coerce")
+        return df[df["value"].notna() & (df["value"] != 0)].assign(country=iso3, year=year)
+    def fetch_data(self, indicators, countries=None):
+        country_years = list(product(countries or list(COUNTRIES.keys()), range(self.start_year, self.end_year + 1)))
+        print(f"  {len(country_years)} country-years...")
+        frames = [df for df in self._fetch_concurrently(lambda args: self._fetch_country_data(*args), country_years) if df is not None and not df.empty]
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["country", "year", "indicator", "value"])
+        df = df[df["indicator"].isin(indicators)]
+        if df.empty: return pd.DataFrame(columns=["country", "year", "indicator", "value"])
+        return df.astype({"value": "float64"}).groupby(["country", "year", "indicator"], sort=False, as_index=False)["value"].sum().astype(FETCH_DTYPES)
+    def collect(self, indicators=None, countries=None):
+        result = IngestionResult(source=self.source_code.value, started_at=utcnow())
+        indicator_codes = indicators or self.indicator_codes
+        try:
+            with session_scope() as session:
+                source = self.get_or_create_source(session)
+                country_map = self._get_country_map(session)
+                indicator_map = self._get_indicator_map(session, source, {code: UNHCR_INDICATORS.get(code, code) for code in indicator_codes})
+                print("Fetching UNHCR data...")
+                df = self.fetch_data(indicator_codes, countries or self.countries)
+                if df.empty: result.status = "completed"; result.completed_at = utcnow(); return result
+                print(f"Records: {len(df)}")
+                result.records_processed = self.upsert_observations(session, self._observation_records(df, country_map, indicator_map), commit=True)
+                source.last_updated = utcnow()
+                result.status = "completed"; result.completed_at = utcnow()
+        except Exception as e: result.status = "failed"; result.errors.append(str(e)); result.completed_at = utcnow()
+        return result
@@ -0,0 +1,3 @@
+"""
+Visualization module for Open Data Platform.
+"""
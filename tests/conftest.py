@@ -0,0 +1,31 @@
+"""
+Shared test fixtures.
+
+Tests that use `session` need the PostgreSQL database from `.env`; they are
+skipped when it cannot be reached.
+"""
+
+from typing import Generator
+
+import pytest
+from sqlalchemy.orm import Session
+
+from open_data.db.connection import check_connection, get_session_factory
+
+
+@pytest.fixture(scope="session")
+def database() -> None:
+    """Skip the test unless the database is reachable."""
+    if not check_connection():
+        pytest.skip("database not reachable")
+
+
+@pytest.fixture
+def session(database: None) -> Generator[Session, None, None]:
+    """A session whose changes are rolled back after the test."""
+    session = get_session_factory()()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
@@ -0,0 +1,36 @@
+"""
+Query budgets for ORM relationship loading.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from open_data.db.debug import count_queries
+from open_data.db.models import Category, Source
+
+
+def test_loading_sources_does_not_load_indicators(session):
+    with count_queries() as queries:
+        session.scalars(select(Source)).all()
+
+    assert len(queries) == 1
+
+
+def test_walking_source_indicators_takes_two_queries(session):
+    with count_queries() as queries:
+        sources = session.scalars(select(Source).options(selectinload(Source.indicators))).all()
+        for source in sources:
+            list(source.indicators)
+
+    assert len(queries) <= 2
+
+
+def test_walking_category_indicators_takes_two_queries(session):
+    with count_queries() as queries:
+        categories = session.scalars(
+            select(Category).options(selectinload(Category.indicators))
+        ).all()
+        for category in categories:
+            list(category.indicators)
+
+    assert len(queries) <= 2
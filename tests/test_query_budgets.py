@@ -0,0 +1,74 @@
+"""
+Query budgets for the hot read APIs.
+
+Each API should cost a fixed number of statements however many countries,
+indicators or years it covers; a regression to per-row queries fails here.
+"""
+
+import pytest
+from sqlalchemy import select
+
+from open_data.core.query import DataQuery, QueryBuilder, get_available_data_summary
+from open_data.core.validation import VALIDATION_CHUNK_SIZE, validate_data
+from open_data.db.connection import get_read_engine, get_table_stats
+from open_data.db.debug import count_queries
+from open_data.db.models import Indicator
+
+
+@pytest.fixture
+def indicator_codes(session) -> list[str]:
+    codes = session.scalars(select(Indicator.code)).all()
+    if not codes:
+        pytest.skip("no indicators loaded")
+    return list(codes)
+
+
+@pytest.mark.parametrize("call", [
+    lambda codes: DataQuery.get_indicator(codes[0]),
+    lambda codes: DataQuery.compare_countries(codes[0], ["USA", "DEU", "FRA"]),
+    lambda codes: DataQuery.get_time_series(codes[0], "USA"),
+    lambda codes: DataQuery.get_latest_values(codes[0]),
+    lambda codes: DataQuery.get_regional_averages(codes[0]),
+    lambda codes: DataQuery.get_multi_indicator(codes, [], 2020),
+    lambda codes: QueryBuilder().select(*codes).years(2000, 2020).pivot().execute(),
+], ids=[
+    "get_indicator",
+    "compare_countries",
+    "get_time_series",
+    "get_latest_values",
+    "get_regional_averages",
+    "get_multi_indicator",
+    "query_builder_pivot",
+])
+def test_data_query_is_one_statement(indicator_codes, call):
+    with count_queries() as queries:
+        call(indicator_codes)
+
+    assert len(queries) == 1
+
+
+def test_data_summary_is_cached(database):
+    get_available_data_summary.invalidate()
+
+    with count_queries() as queries:
+        get_available_data_summary()
+        get_available_data_summary()
+
+    assert len(queries) == 1
+
+
+def test_validate_data_is_bounded_per_chunk(indicator_codes):
+    chunks = -(-len(indicator_codes) // VALIDATION_CHUNK_SIZE)
+
+    with count_queries() as queries:
+        validate_data()
+
+    # The indicator list, then one statement per check and chunk
+    assert len(queries) <= 1 + 4 * chunks
+
+
+def test_table_stats_is_one_statement(database):
+    with count_queries(get_read_engine()) as queries:
+        get_table_stats()
+
+    assert len(queries) == 1
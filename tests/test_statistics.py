@@ -0,0 +1,31 @@
+"""
+Tests for the vectorized statistics helpers.
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from open_data.core.statistics import StatisticalAnalyzer
+
+
+@pytest.mark.parametrize("score", [0.5, 1.0, 2.0, 2.5, 3.0, 4.0])
+def test_percentile_rank_matches_percentileofscore(score):
+    values = np.array([1.0, 2.0, 2.0, 3.0, np.nan])
+
+    expected = stats.percentileofscore(values[~np.isnan(values)], score, kind="rank")
+
+    assert StatisticalAnalyzer.percentile_rank(score, values) == pytest.approx(expected)
+
+
+def test_percentile_rank_of_nan_is_nan():
+    assert np.isnan(StatisticalAnalyzer.percentile_rank(np.nan, np.array([1.0, 2.0, 3.0])))
+
+
+def test_percentile_rank_array_keeps_nan_positions():
+    ranks = StatisticalAnalyzer.percentile_rank(
+        np.array([np.nan, 2.0, 5.0]), np.array([1.0, 2.0, 3.0])
+    )
+
+    assert np.isnan(ranks[0])
+    assert ranks[1:] == pytest.approx([200 / 3, 100.0])